@@ -0,0 +1,71 @@
+import timeit
+import tracemalloc
+
+from aether import render, trusted_mode
+from aether.arena import DocumentArena
+from aether.tags.html import Table, Tbody, Td, Tr
+
+ROWS = 5_000
+COLUMNS = 5
+
+
+def _build_elements() -> Table:
+    return Table()(
+        Tbody()(
+            [
+                Tr()(
+                    [Td(_class="px-2")(f"{row}:{column}") for column in range(COLUMNS)]
+                )
+                for row in range(ROWS)
+            ]
+        )
+    )
+
+
+def _build_arena() -> tuple[DocumentArena, int]:
+    document = DocumentArena()
+    table = document(Table)(
+        document(Tbody)(
+            [
+                document(Tr)(
+                    [
+                        document(Td, _class="px-2")(f"{row}:{column}")
+                        for column in range(COLUMNS)
+                    ]
+                )
+                for row in range(ROWS)
+            ]
+        )
+    )
+    return document, table
+
+
+def _measure_memory(factory) -> int:
+    tracemalloc.start()
+    result = factory()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main() -> None:
+    node_count = ROWS * (COLUMNS * 2 + 1) + 2
+    with trusted_mode():
+        for label, factory in (("elements", _build_elements), ("arena", _build_arena)):
+            print(
+                f"{label + ' build':<24} {timeit.timeit(factory, number=3) / 3 * 1e3:8.2f} ms"
+                f"   {_measure_memory(factory) / node_count:6.1f} bytes/node"
+            )
+
+        table = _build_elements()
+        _, arena_table = _build_arena()
+        if render(table) != render(arena_table):
+            raise RuntimeError("Arena output differs from the element tree output.")
+        for label, tree in (("elements", table), ("arena", arena_table)):
+            seconds = timeit.timeit(lambda tree=tree: render(tree), number=3) / 3
+            print(f"{label + ' render':<24} {seconds * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import time
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from aether import render
+from aether.caching import cached_fragment
+from aether.tags.html import H2, A, Div, Li, P, Ul
+
+NUMBER = 5_000
+THREADS = 32
+
+
+@dataclass
+class Product:
+    id: int
+    name: str
+    description: str
+
+
+def product_card(product: Product) -> Div:
+    return Div(_class="card")(
+        H2()(product.name),
+        P()(product.description),
+        Ul()([Li()(A(href=f"/products/{product.id}/{tab}")(tab)) for tab in TABS]),
+    )
+
+
+TABS = ("details", "reviews", "questions", "shipping")
+cached_product_card = cached_fragment(maxsize=128, key=lambda product: product.id)(
+    product_card
+)
+
+
+def _report(label: str, seconds: float, number: int) -> None:
+    print(f"{label:<44} {seconds / number * 1e6:10.3f} us")
+
+
+def main() -> None:
+    product = Product(1, "Lamp <LED>", "A lamp & a bulb.")
+    if render(product_card(product)) != render(cached_product_card(product)):
+        raise RuntimeError("Cached output differs from the normal one.")
+
+    _report(
+        "render(product_card(product))",
+        min(
+            timeit.repeat(
+                lambda: render(product_card(product)), number=NUMBER, repeat=5
+            )
+        ),
+        NUMBER,
+    )
+    _report(
+        "render(cached_product_card(product))",
+        min(
+            timeit.repeat(
+                lambda: render(cached_product_card(product)), number=NUMBER, repeat=5
+            )
+        ),
+        NUMBER,
+    )
+    print(cached_product_card.cache_info())
+
+    # A fragment expiring under load: every thread misses at the same time.
+    renders = []
+
+    @cached_fragment(key=lambda product: product.id)
+    def slow_product_card(product: Product) -> Div:
+        renders.append(product.id)
+        time.sleep(0.05)
+        return product_card(product)
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        list(executor.map(slow_product_card, [product] * THREADS))
+    print(f"{THREADS} concurrent misses rendered {len(renders)} time(s)")
+
+    # A stale fragment is served while it is refreshed in the background.
+    @cached_fragment(key=lambda product: product.id, soft_ttl=0.01)
+    def stale_product_card(product: Product) -> Div:
+        time.sleep(0.05)
+        return product_card(product)
+
+    stale_product_card(product)
+    time.sleep(0.02)
+    start = time.perf_counter()
+    stale_product_card(product)
+    _report("stale_product_card(product), stale", time.perf_counter() - start, 1)
+    time.sleep(0.1)
+    print(stale_product_card.cache_info())
+
+
+if __name__ == "__main__":
+    main()
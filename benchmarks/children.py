@@ -0,0 +1,34 @@
+import timeit
+
+from aether.tags.html import Li, Table, Tbody, Td, Tr, Ul
+
+NUMBER = 200
+
+
+def _report(label: str, seconds: float, number: int) -> None:
+    print(f"{label:<44} {seconds / number * 1e6:10.3f} us")
+
+
+def main() -> None:
+    items = [Li()(str(index)) for index in range(1_000)]
+    rows = [Tr()(Td()(str(index))) for index in range(1_000)]
+
+    _report(
+        "Ul()(*1000 Li)",
+        timeit.timeit(lambda: Ul()(*items), number=NUMBER),
+        NUMBER,
+    )
+    _report(
+        "Ul()(generator of 1000 Li)",
+        timeit.timeit(lambda: Ul()(item for item in items), number=NUMBER),
+        NUMBER,
+    )
+    _report(
+        "Table()(Tbody()(list of 1000 Tr))",
+        timeit.timeit(lambda: Table()(Tbody()(rows)), number=NUMBER),
+        NUMBER,
+    )
+
+
+if __name__ == "__main__":
+    main()
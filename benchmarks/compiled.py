@@ -0,0 +1,62 @@
+import timeit
+from dataclasses import dataclass
+
+from aether import render, trusted_mode
+from aether.compiled import compiled_component
+from aether.tags.html import A, Td, Tr
+
+NUMBER = 5_000
+
+
+@dataclass
+class User:
+    id: int
+    name: str
+    email: str
+
+
+def row(user: User) -> Tr:
+    return Tr()(
+        Td(_class="name")(user.name),
+        Td()(A(href=f"/users/{user.id}")(user.email)),
+    )
+
+
+compiled_row = compiled_component(row)
+
+
+def _report(label: str, seconds: float, number: int) -> None:
+    print(f"{label:<44} {seconds / number * 1e6:10.3f} us")
+
+
+def main() -> None:
+    user = User(1, "Ada <Lovelace>", "ada@example.com")
+    _report(
+        "render(row(user))",
+        min(timeit.repeat(lambda: render(row(user)), number=NUMBER, repeat=5)),
+        NUMBER,
+    )
+
+    # Compiled components are only used in trusted mode.
+    with trusted_mode():
+        if render(row(user)) != render(compiled_row(user)):
+            raise RuntimeError("Compiled output differs from the normal one.")
+
+        _report(
+            "render(row(user)) [trusted]",
+            min(timeit.repeat(lambda: render(row(user)), number=NUMBER, repeat=5)),
+            NUMBER,
+        )
+        _report(
+            "render(compiled_row(user)) [trusted]",
+            min(
+                timeit.repeat(
+                    lambda: render(compiled_row(user)), number=NUMBER, repeat=5
+                )
+            ),
+            NUMBER,
+        )
+
+
+if __name__ == "__main__":
+    main()
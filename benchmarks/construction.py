@@ -0,0 +1,63 @@
+import re
+import timeit
+
+from aether import deferred_validation, set_validation_cache_size, trusted_mode
+from aether.base import attribute_key_normalizer
+from aether.tags.html import Button, Div, Li, Td
+
+KEYS = ["_class", "id", "hx_get", "hx_target", "aria_label", "x_on_click", "style"]
+NUMBER = 20_000
+
+
+def _regex_normalize(key: str) -> str:
+    return re.sub(r"^_", "", key).replace("_", "-")
+
+
+def _report(label: str, seconds: float, number: int) -> None:
+    print(f"{label:<44} {seconds / number * 1e6:8.3f} us")
+
+
+def main() -> None:
+    _report(
+        "key normalization (re.sub)",
+        timeit.timeit(lambda: [_regex_normalize(key) for key in KEYS], number=NUMBER),
+        NUMBER,
+    )
+    _report(
+        "key normalization (cached)",
+        timeit.timeit(
+            lambda: [attribute_key_normalizer.normalize(key) for key in KEYS],
+            number=NUMBER,
+        ),
+        NUMBER,
+    )
+
+    elements = {
+        "Div(_class, hx_get, hx_target)": lambda: Div(
+            _class="row", hx_get="/rows", hx_target="#table"
+        ),
+        "Td(_class)": lambda: Td(_class="px-2 py-1"),
+        "Li(_class, aria_label)": lambda: Li(_class="item", aria_label="Item"),
+        "Button(popovertarget)": lambda: Button(popovertarget="menu"),
+    }
+    for label, factory in elements.items():
+        _report(label, timeit.timeit(factory, number=NUMBER), NUMBER)
+
+    set_validation_cache_size(1024)
+    for label, factory in elements.items():
+        _report(f"{label} [cached]", timeit.timeit(factory, number=NUMBER), NUMBER)
+    set_validation_cache_size(0)
+
+    with deferred_validation():
+        for label, factory in elements.items():
+            _report(
+                f"{label} [deferred]", timeit.timeit(factory, number=NUMBER), NUMBER
+            )
+
+    with trusted_mode():
+        for label, factory in elements.items():
+            _report(f"{label} [trusted]", timeit.timeit(factory, number=NUMBER), NUMBER)
+
+
+if __name__ == "__main__":
+    main()
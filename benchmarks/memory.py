@@ -0,0 +1,104 @@
+import tracemalloc
+
+from aether import trusted_mode
+from aether.tags.html import Li, Table, Tbody, Td, Tr, Ul
+
+ROWS = 20_000
+
+
+class DictLayoutElement:
+    # The element layout before `__slots__`, for comparison: a `__dict__` per
+    # element, holding containers of its own even when they are empty.
+    def __init__(self, attributes: dict | None = None) -> None:
+        self.attributes = dict(attributes or {})
+        self.children = []
+        self.escape_quote = True
+        self._pending_validation = None
+
+    def __call__(self, *children) -> "DictLayoutElement":
+        for child in children:
+            if isinstance(child, list):
+                self.children.extend(child)
+            else:
+                self.children.append(child)
+        return self
+
+
+def _build_dict_layout_table() -> DictLayoutElement:
+    # With the attributes (defaults included) that `Td` ends up with.
+    element = DictLayoutElement
+    return element()(
+        element()(
+            [
+                element()(
+                    element({"class": "px-2 py-1", "colspan": 1, "rowspan": 1})(
+                        str(index)
+                    ),
+                    element({"colspan": 1, "rowspan": 1})(),
+                    element({"colspan": 1, "rowspan": 1})("x"),
+                )
+                for index in range(ROWS)
+            ]
+        )
+    )
+
+
+def _build_dict_layout_list() -> DictLayoutElement:
+    return DictLayoutElement()([DictLayoutElement()() for _ in range(ROWS)])
+
+
+def _build_table() -> Table:
+    return Table()(
+        Tbody()(
+            [
+                Tr()(Td(_class="px-2 py-1")(str(index)), Td()(), Td()("x"))
+                for index in range(ROWS)
+            ]
+        )
+    )
+
+
+def _build_list() -> Ul:
+    return Ul()([Li()() for _ in range(ROWS)])
+
+
+def _measure(factory) -> int:
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    tree = factory()
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(
+        stat.size_diff
+        for stat in snapshot_after.compare_to(snapshot_before, "filename")
+    )
+    del tree
+    return allocated
+
+
+def _report(label: str, before: int, after: int, node_count: int) -> None:
+    print(
+        f"{label:<28} {before / node_count:8.1f} -> {after / node_count:8.1f} bytes/node"
+    )
+
+
+def main() -> None:
+    print(f"{'':<28} {'__dict__':>8}    {'__slots__':>8}")
+    with trusted_mode():
+        _report(
+            "table (4 nodes per row)",
+            _measure(_build_dict_layout_table),
+            _measure(_build_table),
+            ROWS * 4 + 2,
+        )
+        _report(
+            "list of empty Li",
+            _measure(_build_dict_layout_list),
+            _measure(_build_list),
+            ROWS + 1,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import io
+import timeit
+import tracemalloc
+
+from aether import freeze, render, render_to
+from aether.tags.html import A, Div, Li, Nav, Span, Table, Td, Tr, Ul
+
+NUMBER = 20
+DEPTH = 500
+WIDTH = 10_000
+TAILWIND_CLASSES = (
+    "flex items-center justify-between px-4 py-2 text-sm font-medium "
+    "text-gray-700 hover:bg-gray-100 rounded-md"
+)
+
+
+def _report(label: str, seconds: float, number: int) -> None:
+    print(f"{label:<44} {seconds / number * 1e3:10.3f} ms")
+
+
+def _build_deep() -> Div:
+    element = Span()("leaf")
+    for _ in range(DEPTH):
+        element = Div()(element, "text")
+    return element
+
+
+def _build_wide() -> Ul:
+    return Ul()([Li()(Span()(str(index))) for index in range(WIDTH)])
+
+
+def _build_styled() -> Ul:
+    return Ul(_class="divide-y")(
+        [
+            Li(_class=TAILWIND_CLASSES)(
+                A(href="/items", _class=TAILWIND_CLASSES)(Span()(str(index)))
+            )
+            for index in range(WIDTH // 5)
+        ]
+    )
+
+
+def _build_table() -> Table:
+    return Table()(
+        [
+            Tr()(
+                [
+                    Td(colspan=1)(A(href=f"/{row}/{column}")(column))
+                    for column in range(10)
+                ]
+            )
+            for row in range(WIDTH // 50)
+        ]
+    )
+
+
+def _build_navigation() -> Nav:
+    return Nav(_class="navbar")(
+        Ul()([Li()(A(href=f"/{index}")(f"Page {index}")) for index in range(20)])
+    )
+
+
+def _report_peak_memory(label: str, function) -> None:
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<44} {peak / 1024:10.1f} KiB peak")
+
+
+class _NullWriter(io.TextIOBase):
+    def write(self, data: str) -> int:
+        return len(data)
+
+
+def main() -> None:
+    deep = _build_deep()
+    wide = _build_wide()
+
+    _report(
+        f"render(Div nested {DEPTH} deep)",
+        timeit.timeit(lambda: render(deep), number=NUMBER),
+        NUMBER,
+    )
+    _report(
+        f"render(Ul with {WIDTH} Li > Span)",
+        timeit.timeit(lambda: render(wide), number=NUMBER),
+        NUMBER,
+    )
+    _report(
+        f"render_to(Ul with {WIDTH} Li > Span)",
+        timeit.timeit(lambda: render_to(_NullWriter(), wide), number=NUMBER),
+        NUMBER,
+    )
+    styled = _build_styled()
+    _report(
+        f"render(Ul with {WIDTH // 5} styled Li > A > Span)",
+        timeit.timeit(lambda: render(styled), number=NUMBER),
+        NUMBER,
+    )
+    _report(
+        f"render(Table with {WIDTH // 5} Td with defaults)",
+        timeit.timeit(lambda: render(_build_table()), number=NUMBER),
+        NUMBER,
+    )
+    navigation = _build_navigation()
+    frozen_navigation = freeze(navigation)
+    _report(
+        "render(Div()(navigation))",
+        timeit.timeit(lambda: render(Div()(navigation)), number=NUMBER * 50),
+        NUMBER * 50,
+    )
+    _report(
+        "render(Div()(freeze(navigation)))",
+        timeit.timeit(lambda: render(Div()(frozen_navigation)), number=NUMBER * 50),
+        NUMBER * 50,
+    )
+
+    _report_peak_memory(f"render(Ul with {WIDTH} Li > Span)", lambda: render(wide))
+    _report_peak_memory(
+        f"render_to(Ul with {WIDTH} Li > Span)",
+        lambda: render_to(_NullWriter(), wide),
+    )
+
+
+if __name__ == "__main__":
+    main()
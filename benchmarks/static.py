@@ -0,0 +1,69 @@
+import timeit
+
+from aether import render, set_static_cache_size
+from aether.tags.html import A, Div, Footer, Li, Nav, P, Span, Table, Tbody, Td, Tr, Ul
+from aether.utils import static_subtree_cache
+
+NUMBER = 50
+ROWS = list(range(50))
+
+
+def _report(label: str, seconds: float, number: int) -> None:
+    print(f"{label:<44} {seconds / number * 1e3:10.3f} ms")
+
+
+def _build_page(rows: list[int]) -> Div:
+    return Div()(
+        Nav(_class="navbar")(
+            Ul()(
+                [
+                    Li(_class="nav-item")(A(href=f"/{index}")(f"Page {index}"))
+                    for index in range(20)
+                ]
+            )
+        ),
+        Table()(
+            Tbody()(
+                [Tr()(Td()(str(row)), Td()(Span(_class="badge")("ok"))) for row in rows]
+            )
+        ),
+        Footer()(
+            P()("(c) Example"),
+            Ul()(
+                [
+                    Li()(A(href=f"/legal/{index}")(f"Legal {index}"))
+                    for index in range(10)
+                ]
+            ),
+        ),
+    )
+
+
+def main() -> None:
+    for maxsize in (0, 4_096):
+        set_static_cache_size(maxsize)
+        page = _build_page(ROWS)
+        _report(
+            f"build (static cache {maxsize})",
+            min(timeit.repeat(lambda: _build_page(ROWS), number=NUMBER, repeat=5)),
+            NUMBER,
+        )
+        _report(
+            f"render (static cache {maxsize})",
+            min(timeit.repeat(lambda page=page: render(page), number=NUMBER, repeat=5)),
+            NUMBER,
+        )
+        _report(
+            f"build + render (static cache {maxsize})",
+            min(
+                timeit.repeat(
+                    lambda: render(_build_page(ROWS)), number=NUMBER, repeat=5
+                )
+            ),
+            NUMBER,
+        )
+    print(static_subtree_cache.info())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import os
+import time
+import timeit
+
+from aether import iter_render, render, render_bytes, render_to_fd
+from aether.tags.html import Table, Tbody, Td, Tr
+
+ROWS = 5_000
+COLUMNS = 5
+CHUNK_SIZES = (1_024, 4_096, 16_384, 65_536)
+
+
+def _build_table() -> Table:
+    return Table()(
+        Tbody()(
+            [
+                Tr()(
+                    [Td(_class="px-2")(f"{row}:{column}") for column in range(COLUMNS)]
+                )
+                for row in range(ROWS)
+            ]
+        )
+    )
+
+
+def _stream(chunks, fd: int) -> tuple[int, float]:
+    # One `os.write` per message stands in for a socket send or ASGI message.
+    count = 0
+    start = time.perf_counter()
+    for chunk in chunks:
+        os.write(fd, chunk.encode())
+        count += 1
+    return count, time.perf_counter() - start
+
+
+def main() -> None:
+    table = _build_table()
+    fd = os.open(os.devnull, os.O_WRONLY)
+    try:
+        fragments, seconds = _stream(table.render(), fd)
+        size = sum(len(fragment) for fragment in table.render())
+        print(
+            f"{'render() fragments':<28} {fragments:>8} messages "
+            f"{size / seconds / 1e6:8.1f} MB/s"
+        )
+        for chunk_size in CHUNK_SIZES:
+            chunks, seconds = _stream(iter_render(table, chunk_size=chunk_size), fd)
+            print(
+                f"{f'iter_render({chunk_size})':<28} {chunks:>8} messages "
+                f"{size / seconds / 1e6:8.1f} MB/s "
+                f"({fragments / chunks:.0f} fragments per chunk)"
+            )
+
+        for label, function in (
+            ("render().encode()", lambda: render(table).encode()),
+            ("render_bytes()", lambda: render_bytes(table)),
+            ("render_to_fd()", lambda: render_to_fd(fd, table)),
+        ):
+            seconds = min(timeit.repeat(function, number=1, repeat=5))
+            print(f"{label:<28} {seconds * 1e3:8.1f} ms")
+    finally:
+        os.close(fd)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+import ast
+import hashlib
+import importlib
+import inspect
+import sys
+from pathlib import Path
+from typing import Any
+
+import click
+from rich.console import Console
+from rich.traceback import install
+
+from aether import __version__ as aether_version
+from aether.compiled import TracedComponent, _Slot, trace_component
+
+install(extra_lines=0, max_frames=10)
+
+
+def is_literal(value: Any) -> bool:
+    try:
+        return ast.literal_eval(repr(value)) == value
+    except (ValueError, SyntaxError):
+        return False
+
+
+def get_slot_value_expression(slot: _Slot) -> str | None:
+    expression = slot.name
+    for operation in slot.operations:
+        if operation[0] == "getattr":
+            expression += f".{operation[1]}"
+        elif operation[0] == "getitem":
+            if not is_literal(operation[1]):
+                return None
+            expression += f"[{operation[1]!r}]"
+        else:
+            _, args, kwargs = operation
+            if not all(is_literal(value) for value in (*args, *kwargs.values())):
+                return None
+            arguments = [repr(value) for value in args]
+            arguments += [f"{key}={value!r}" for key, value in kwargs.items()]
+            expression += f"({', '.join(arguments)})"
+    return expression
+
+
+def get_slot_expression(slot: _Slot) -> str | None:
+    value = get_slot_value_expression(slot)
+    if value is None:
+        return None
+    elif slot.attribute_key is not None:
+        return f"_render_attribute_value({slot.attribute_key!r}, {value})"
+    elif slot.kind == "s" and slot.escape_quote is not None:
+        return f"_render_child_value({value}, {slot.escape_quote})"
+
+    text = f"format({value})" if slot.kind == "f" else f"str({value})"
+    if slot.escape_quote is None:
+        return text
+    return f"_escape_html({text}, quote={slot.escape_quote})"
+
+
+def get_signature(function: Any) -> str | None:
+    # Annotations are dropped, they may refer to names the generated module
+    # does not import. Defaults have to be literals.
+    signature = inspect.signature(function)
+    parameters = []
+    for parameter in signature.parameters.values():
+        if parameter.default is not parameter.empty and not is_literal(
+            parameter.default
+        ):
+            return None
+        parameters.append(parameter.replace(annotation=parameter.empty))
+    return str(
+        signature.replace(
+            parameters=parameters, return_annotation=inspect.Signature.empty
+        )
+    )
+
+
+def get_call_arguments(function: Any) -> str:
+    arguments = []
+    for parameter in inspect.signature(function).parameters.values():
+        if parameter.kind is parameter.KEYWORD_ONLY:
+            arguments.append(f"{parameter.name}={parameter.name}")
+        else:
+            arguments.append(parameter.name)
+    return ", ".join(arguments)
+
+
+def generate_function(
+    name: str, function: Any, traced_component: TracedComponent, frozen_class: str
+) -> str | None:
+    signature = get_signature(function)
+    if signature is None:
+        return None
+
+    parts = []
+    for segment in traced_component.segments:
+        part = (
+            repr(segment) if isinstance(segment, str) else get_slot_expression(segment)
+        )
+        if part is None:
+            return None
+        parts.append(part)
+
+    # Slot values are not validated, outside of trusted mode (or for attribute
+    # values that are `None` or booleans) the source component is called.
+    body = "\n                + ".join(parts)
+    return (
+        f"def {name}{signature}:\n"
+        f"    if _is_trusted_mode():\n"
+        f"        try:\n"
+        f"            return {frozen_class}(\n                {body}\n            )\n"
+        f"        except _DataDependentStructure:\n"
+        f"            pass\n"
+        f"    return _source_module.{name}({get_call_arguments(function)})\n"
+    )
+
+
+def get_source_hash(module: Any) -> str:
+    source = Path(inspect.getfile(module)).read_bytes()
+    return hashlib.sha256(source + aether_version.encode()).hexdigest()
+
+
+def generate_module(module: Any) -> tuple[str, list[str], list[str]]:
+    element_imports = [
+        "from aether.base import _get_frozen_class",
+        "from aether.compiled import (\n"
+        "    _DataDependentStructure,\n"
+        "    _render_attribute_value,\n"
+        "    _render_child_value,\n"
+        ")",
+        "from aether.utils import is_trusted_mode as _is_trusted_mode",
+    ]
+    source_imports = []
+    frozen_classes: dict[type, str] = {}
+    functions = []
+    compiled, skipped = [], []
+
+    for name, component in inspect.getmembers(module, inspect.isfunction):
+        if not getattr(component, "__compiled_component__", False):
+            continue
+
+        function = component.__wrapped__
+        traced_component = trace_component(function)
+        generated_function = None
+        if traced_component is not None:
+            element_class = traced_component.element_class
+            if element_class not in frozen_classes:
+                element_imports.append(
+                    f"from {element_class.__module__} import {element_class.__qualname__}"
+                )
+                frozen_classes[element_class] = f"_Frozen{element_class.__qualname__}"
+            generated_function = generate_function(
+                name, function, traced_component, frozen_classes[element_class]
+            )
+
+        if generated_function is None:
+            source_imports.append(f"from {module.__name__} import {name}")
+            skipped.append(name)
+        else:
+            functions.append(generated_function)
+            compiled.append(name)
+
+    header = (
+        "# Generated by scripts/compile_components.py, do not edit.\n"
+        f"# Source: {module.__name__} (sha256: {get_source_hash(module)})\n"
+    )
+    frozen_class_definitions = [
+        f"{frozen_class} = _get_frozen_class({element_class.__qualname__})"
+        for element_class, frozen_class in frozen_classes.items()
+    ]
+    code = "\n".join(
+        [
+            header,
+            "from html import escape as _escape_html",
+            "",
+            *sorted(element_imports),
+            "",
+            f"import {module.__name__} as _source_module",
+            *source_imports,
+            "",
+            "",
+            *frozen_class_definitions,
+            "",
+            "",
+            "\n\n".join(functions),
+        ]
+    )
+    return code, compiled, skipped
+
+
+def is_up_to_date(module: Any, output_path: Path) -> bool:
+    if not output_path.exists():
+        return False
+    with open(output_path) as f:
+        f.readline()
+        return f"sha256: {get_source_hash(module)}" in f.readline()
+
+
+@click.command()
+@click.argument("modules", nargs=-1, required=True)
+@click.option(
+    "--output-dir",
+    "-o",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=Path("compiled_components"),
+    show_default=True,
+    help="Directory where the generated modules are written",
+)
+@click.option(
+    "--check",
+    "-c",
+    is_flag=True,
+    help="Only check that the generated modules are up to date",
+)
+def main(modules: tuple[str, ...], output_dir: Path, check: bool):
+    console = Console()
+    sys.path.insert(0, str(Path.cwd()))
+
+    outdated = []
+    for module_name in modules:
+        module = importlib.import_module(module_name)
+        output_path = output_dir / f"{module_name.replace('.', '_')}.py"
+
+        if is_up_to_date(module, output_path):
+            console.print(f"[green]Up to date[/green]: [cyan]{output_path}[/cyan]")
+            continue
+        elif check:
+            outdated.append(output_path)
+            console.print(f"[red]Outdated[/red]: [cyan]{output_path}[/cyan]")
+            continue
+
+        code, compiled, skipped = generate_module(module)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(code)
+        console.print(
+            f"Compiled [bold cyan]{module_name}[/bold cyan] into [cyan]{output_path}[/cyan]: "
+            f"[green]{len(compiled)} compiled[/green], [yellow]{len(skipped)} kept as is[/yellow]"
+        )
+        for name in skipped:
+            console.print(
+                f"  [yellow]`{name}`[/yellow] depends on its arguments, it is imported from the source module"
+            )
+
+    if outdated:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,27 @@
-from .base import BaseAttribute, BaseWebElement, WebElementType
+import asyncio
+import os
+import sys
+from collections.abc import AsyncGenerator, Callable, Generator, Iterable
+from typing import Any, Protocol
+
+from .base import (
+    BaseAttribute,
+    BaseWebElement,
+    Suspense,
+    WebElementType,
+    _arender_tree,
+    freeze,
+    validate_tree,
+)
 from .safe_string import mark_safe
+from .utils import (
+    deferred_validation,
+    set_deferred_validation,
+    set_static_cache_size,
+    set_trusted_mode,
+    set_validation_cache_size,
+    trusted_mode,
+)
 
 
 def render(*elements: BaseWebElement, stringify: bool = True) -> str:
@@ -9,12 +31,199 @@ def render(*elements: BaseWebElement, stringify: bool = True) -> str:
     return mark_safe("").join(rendered_elements)
 
 
+class SupportsWrite(Protocol):
+    def write(self, data: str | bytes, /) -> Any: ...
+
+
+def iter_render(
+    *elements: BaseWebElement,
+    chunk_size: int = 16_384,
+    first_chunk_size: int | None = None,
+) -> Generator[str, None, None]:
+    # Coalesces the many small fragments yielded by `render` into chunks of
+    # about `chunk_size` characters, e.g. one per message of a streaming HTTP
+    # response. `first_chunk_size` lets a smaller first chunk (the `<head>`)
+    # out early so the client can start fetching assets.
+    buffer = []
+    buffered_size = 0
+    threshold = first_chunk_size or chunk_size
+    for element in elements:
+        for fragment in element.render():
+            buffer.append(fragment)
+            buffered_size += len(fragment)
+            if buffered_size >= threshold:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered_size = 0
+                threshold = chunk_size
+
+    if buffer:
+        yield "".join(buffer)
+
+
+def render_to(
+    writer: SupportsWrite | Callable[[str | bytes], Any],
+    *elements: BaseWebElement,
+    flush_threshold: int = 65_536,
+    encoding: str | None = None,
+) -> int:
+    # With an `encoding`, bytes are written (as WSGI's `write` and binary files
+    # expect) and the number of bytes is returned instead of characters.
+    write = getattr(writer, "write", writer)
+    if encoding is None:
+        chunks = iter_render(*elements, chunk_size=flush_threshold)
+    else:
+        chunks = iter_render_bytes(
+            *elements, chunk_size=flush_threshold, encoding=encoding
+        )
+
+    total_size = 0
+    for chunk in chunks:
+        write(chunk)
+        total_size += len(chunk)
+    return total_size
+
+
+def iter_render_bytes(
+    *elements: BaseWebElement,
+    chunk_size: int = 16_384,
+    first_chunk_size: int | None = None,
+    encoding: str = "utf-8",
+) -> Generator[bytes, None, None]:
+    # Encoding a whole chunk at once is about twice as fast as encoding (or
+    # looking up pre-encoded) fragments one by one.
+    for chunk in iter_render(
+        *elements, chunk_size=chunk_size, first_chunk_size=first_chunk_size
+    ):
+        yield chunk.encode(encoding)
+
+
+def render_bytes(*elements: BaseWebElement, encoding: str = "utf-8") -> bytes:
+    return b"".join(iter_render_bytes(*elements, encoding=encoding))
+
+
+def render_to_fd(
+    fd: int,
+    *elements: BaseWebElement,
+    chunk_size: int = 16_384,
+    batch_size: int = 16,
+    encoding: str = "utf-8",
+) -> int:
+    # Encoded chunks are handed to the kernel `batch_size` at a time with a
+    # single `os.writev` call (where available).
+    writev = getattr(os, "writev", None)
+    if writev is None:
+        batch_size = 1
+    total_size = 0
+    batch = []
+    for chunk in iter_render_bytes(*elements, chunk_size=chunk_size, encoding=encoding):
+        batch.append(chunk)
+        if len(batch) >= batch_size:
+            total_size += _write_all(fd, batch, writev)
+            batch.clear()
+
+    if batch:
+        total_size += _write_all(fd, batch, writev)
+    return total_size
+
+
+def _write_all(
+    fd: int, buffers: list[bytes], writev: Callable[[int, list], int] | None
+) -> int:
+    total_size = sum(len(buffer) for buffer in buffers)
+    pending = [memoryview(buffer) for buffer in buffers]
+    while pending:
+        written = writev(fd, pending) if writev else os.write(fd, pending[0])
+        # Drop what was written, partially written buffers are sliced in place.
+        while pending and written >= len(pending[0]):
+            written -= len(pending.pop(0))
+        if written:
+            pending[0] = pending[0][written:]
+    return total_size
+
+
+async def aiter_render(
+    *elements: BaseWebElement, chunk_size: int = 16_384
+) -> AsyncGenerator[str, None]:
+    # Same chunks as `iter_render`, except that whatever is buffered is also
+    # sent out before waiting on an awaitable (or async iterator) child.
+    # `Suspense` children come last, in the order they finish, but still inside
+    # the body: `</body>` and whatever follows it are held back until then.
+    suspended: list[asyncio.Task] = []
+    buffer = []
+    buffered_size = 0
+    tail = []
+    try:
+        for element in elements:
+            if isinstance(element, BaseWebElement):
+                fragments = _arender_tree(element, suspended)
+            else:
+                fragments = _aiter_fragments(element.render())
+
+            async for fragment in fragments:
+                if tail or (suspended and fragment == "</body>"):
+                    if fragment is not None:
+                        tail.append(fragment)
+                    continue
+                if fragment is None:
+                    if buffer:
+                        yield "".join(buffer)
+                        buffer.clear()
+                        buffered_size = 0
+                    continue
+
+                buffer.append(fragment)
+                buffered_size += len(fragment)
+                if buffered_size >= chunk_size:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    buffered_size = 0
+
+        if buffer:
+            yield "".join(buffer)
+        for suspended_content in asyncio.as_completed(suspended):
+            yield await suspended_content
+        if tail:
+            yield "".join(tail)
+    finally:
+        for task in suspended:
+            task.cancel()
+
+
+async def arender(*elements: BaseWebElement) -> str:
+    chunks = [chunk async for chunk in aiter_render(*elements, chunk_size=sys.maxsize)]
+    return mark_safe("").join(chunks)
+
+
+async def _aiter_fragments(
+    fragments: Iterable[str],
+) -> AsyncGenerator[str, None]:
+    for fragment in fragments:
+        yield fragment
+
+
 __version__ = "0.4.23"
 __all__ = [
     "render",
+    "render_to",
+    "iter_render",
+    "render_bytes",
+    "iter_render_bytes",
+    "render_to_fd",
+    "arender",
+    "aiter_render",
     "BaseAttribute",
     "BaseWebElement",
+    "Suspense",
     "WebElementType",
+    "deferred_validation",
+    "freeze",
     "mark_safe",
+    "set_deferred_validation",
+    "set_static_cache_size",
+    "set_trusted_mode",
+    "set_validation_cache_size",
+    "trusted_mode",
+    "validate_tree",
     "__version__",
 ]
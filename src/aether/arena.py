@@ -0,0 +1,345 @@
+from array import array
+from collections.abc import Generator, Iterable
+from typing import Any, Self
+
+from .base import (
+    _UNMATCHED,
+    EMPTY_ATTRIBUTES,
+    EMPTY_CHILDREN,
+    BaseWebElement,
+    LazyChildren,
+    validate_tree,
+)
+from .safe_string import SafeString, mark_safe, safestring_escape
+from .tags.html import Html
+from .utils import AttributeDict, flatten_attributes, is_trusted_mode
+
+NO_NODE = -1
+
+
+class ArenaNode:
+    __slots__ = ("arena", "index")
+
+    def __init__(self, arena: "DocumentArena", index: int) -> None:
+        self.arena = arena
+        self.index = index
+
+    def __call__(self, *children: Any) -> Self:
+        self.arena.append_children(self.index, children)
+        return self
+
+    def render(self, stringify: bool = True) -> Generator[str, None, None]:
+        yield self.arena.render(self.index)
+
+    def __html__(self) -> SafeString:
+        # Lets an arena subtree be used as a child of ordinary elements.
+        return self.arena.render(self.index)
+
+    def to_element(self) -> BaseWebElement | SafeString:
+        return self.arena.to_element(self.index)
+
+
+class DocumentArena:
+    def __init__(self) -> None:
+        # One entry per node in each of these parallel arrays. Text nodes have
+        # a tag id of `NO_NODE` and point into `texts` instead of `attributes`.
+        self.tag_ids = array("i")
+        self.attribute_ids = array("i")
+        self.text_ids = array("i")
+        self.parents = array("i")
+        self.first_children = array("i")
+        self.last_children = array("i")
+        self.next_siblings = array("i")
+
+        self.tag_classes: list[type[BaseWebElement]] = []
+        self.escape_quotes: list[bool] = []
+        self.attributes: list[dict] = []
+        self.attribute_strings: list[str] = []
+        self.texts: list[str] = []
+        self.doctypes: dict[int, str] = {}
+
+        self._tag_ids: dict[tuple[type, bool], int] = {}
+        self._attribute_ids: dict[str, int] = {}
+        self._attribute_ids_by_input: dict[tuple, tuple[int, str | None]] = {}
+
+    def __len__(self) -> int:
+        return len(self.tag_ids)
+
+    def __call__(self, tag_class: type[BaseWebElement], **attributes: Any) -> ArenaNode:
+        # Attributes go through the tag's own validation and defaults once per
+        # distinct attribute set (and mode, trusted attributes are not checked),
+        # the element itself is thrown away.
+        node_data = None
+        input_key = (
+            tag_class,
+            is_trusted_mode(),
+            tuple((key, type(value), value) for key, value in attributes.items()),
+        )
+        try:
+            node_data = self._attribute_ids_by_input.get(input_key)
+        except TypeError:
+            input_key = None
+
+        if node_data is None:
+            element = tag_class(**attributes)
+            if element._pending_validation is not None:
+                validate_tree(element)
+            doctype = None
+            if isinstance(element, Html) and element.doctype_value:
+                doctype = f"<!DOCTYPE {element.doctype_value}>"
+            node_data = (self._add_attributes(element._attributes), doctype)
+            if input_key is not None:
+                self._attribute_ids_by_input[input_key] = node_data
+
+        attribute_id, doctype = node_data
+        tag_id = self._get_tag_id(tag_class, True)
+        index = self._add_node(tag_id, attribute_id, NO_NODE)
+        if doctype is not None:
+            self.doctypes[index] = doctype
+        return ArenaNode(self, index)
+
+    def _get_tag_id(self, tag_class: type[BaseWebElement], escape_quote: bool) -> int:
+        tag_id = self._tag_ids.get((tag_class, escape_quote))
+        if tag_id is None:
+            tag_id = len(self.tag_classes)
+            self.tag_classes.append(tag_class)
+            self.escape_quotes.append(escape_quote)
+            self._tag_ids[(tag_class, escape_quote)] = tag_id
+        return tag_id
+
+    def _add_attributes(self, attributes: dict) -> int:
+        attribute_string = flatten_attributes(attributes)
+        attribute_string = (
+            (" " + attribute_string) if attribute_string else attribute_string
+        )
+        attribute_id = self._attribute_ids.get(attribute_string)
+        if attribute_id is None:
+            attribute_id = len(self.attribute_strings)
+            self.attributes.append(dict(attributes))
+            self.attribute_strings.append(attribute_string)
+            self._attribute_ids[attribute_string] = attribute_id
+        return attribute_id
+
+    def _add_node(self, tag_id: int, attribute_id: int, text_id: int) -> int:
+        index = len(self.tag_ids)
+        self.tag_ids.append(tag_id)
+        self.attribute_ids.append(attribute_id)
+        self.text_ids.append(text_id)
+        self.parents.append(NO_NODE)
+        self.first_children.append(NO_NODE)
+        self.last_children.append(NO_NODE)
+        self.next_siblings.append(NO_NODE)
+        return index
+
+    def _add_text(self, text: str) -> int:
+        self.texts.append(text)
+        return self._add_node(NO_NODE, NO_NODE, len(self.texts) - 1)
+
+    def _link(self, parent: int, child: int) -> None:
+        self.parents[child] = parent
+        last_child = self.last_children[parent]
+        if last_child == NO_NODE:
+            self.first_children[parent] = child
+        else:
+            self.next_siblings[last_child] = child
+        self.last_children[parent] = child
+
+    def append_children(self, parent: int, children: Iterable[Any]) -> None:
+        tag_class = self.tag_classes[self.tag_ids[parent]]
+        if not tag_class.have_children:
+            raise ValueError(
+                f"Trying to add child to a non-child element: {tag_class.__qualname__}"
+            )
+        escape_quote = self.escape_quotes[self.tag_ids[parent]]
+        child_model = tag_class.child_model
+
+        # Children are only linked once the whole call is valid, as with
+        # `BaseWebElement.__call__`.
+        indexes = []
+        attached_nodes = set()
+        child_counts = (
+            dict.fromkeys(child_model.counted_types, 0)
+            if child_model is not None
+            else None
+        )
+        for child in children:
+            if (
+                isinstance(child, str)
+                or isinstance(child, ArenaNode | BaseWebElement)
+                or not isinstance(child, Iterable)
+            ):
+                child = (child,)
+
+            for node in child:
+                if node is None:
+                    continue
+                elif isinstance(node, ArenaNode):
+                    if node.arena is not self:
+                        raise ValueError("Arena nodes cannot be moved across arenas.")
+                    if self.parents[node.index] != NO_NODE or (
+                        node.index in attached_nodes
+                    ):
+                        raise ValueError("Arena node is already attached to a parent.")
+                    index = node.index
+                    attached_nodes.add(index)
+                elif isinstance(node, BaseWebElement):
+                    index = self.from_element(node).index
+                else:
+                    index = self._add_text(safestring_escape(node, escape_quote))
+
+                if child_model is not None:
+                    child_class = self._get_node_class(index) or str
+                    matched_types = child_model.matched_types_by_class.get(
+                        child_class, _UNMATCHED
+                    )
+                    if matched_types is _UNMATCHED:
+                        matched_types = child_model.match(child_class)
+                    if matched_types is None:
+                        raise ValueError(child_model.invalid_child_message(tag_class))
+                    for matched_type in matched_types:
+                        child_counts[matched_type] += 1
+                indexes.append(index)
+
+        if child_model is not None and (
+            child_model.cardinality
+            or tag_class._check_children is not BaseWebElement._check_children
+        ):
+            # Checked on a stand-in element, `_check_children` may drop
+            # attributes that the children replace.
+            element = self._new_element(parent)
+            child_model.check_cardinality(element, child_counts)
+            element._check_children(child_counts)
+            if element._attributes != self.attributes[self.attribute_ids[parent]]:
+                self.attribute_ids[parent] = self._add_attributes(element._attributes)
+
+        for index in indexes:
+            self._link(parent, index)
+
+    def _get_node_class(self, index: int) -> type | None:
+        tag_id = self.tag_ids[index]
+        return None if tag_id == NO_NODE else self.tag_classes[tag_id]
+
+    def from_element(self, element: BaseWebElement) -> ArenaNode:
+        root = self._add_element(element)
+        stack = [(element, root)]
+        while stack:
+            element, index = stack.pop()
+            if self.tag_ids[index] == NO_NODE or not element.have_children:
+                continue
+
+            for child in element._children:
+                nodes = child if isinstance(child, LazyChildren) else (child,)
+                for node in nodes:
+                    if isinstance(node, BaseWebElement):
+                        child_index = self._add_element(node)
+                        stack.append((node, child_index))
+                    elif node is not None:
+                        child_index = self._add_text(
+                            safestring_escape(node, element.escape_quote)
+                        )
+                    else:
+                        continue
+                    self._link(index, child_index)
+        return ArenaNode(self, root)
+
+    def _add_element(self, element: BaseWebElement) -> int:
+        if element._pending_validation is not None:
+            validate_tree(element, warn_lazy=False)
+
+        # Elements with their own `render` are kept as pre-rendered text.
+        element_class = element.__class__
+        if element_class.render is not BaseWebElement.render:
+            return self._add_text(mark_safe("").join(element.render()))
+
+        index = self._add_node(
+            self._get_tag_id(element_class, element.escape_quote),
+            self._add_attributes(element._attributes),
+            NO_NODE,
+        )
+        if isinstance(element, Html) and element.doctype_value:
+            self.doctypes[index] = f"<!DOCTYPE {element.doctype_value}>"
+        return index
+
+    def render(self, root: int) -> SafeString:
+        tag_ids = self.tag_ids
+        first_children = self.first_children
+        next_siblings = self.next_siblings
+        parents = self.parents
+        tag_classes = self.tag_classes
+        attribute_ids = self.attribute_ids
+        attribute_strings = self.attribute_strings
+        texts = self.texts
+        text_ids = self.text_ids
+        doctypes = self.doctypes
+
+        parts = []
+        index = root
+        while True:
+            # Opening tag, or text, of the current node.
+            tag_id = tag_ids[index]
+            if tag_id == NO_NODE:
+                parts.append(texts[text_ids[index]])
+            else:
+                tag_class = tag_classes[tag_id]
+                if doctypes and index in doctypes:
+                    parts.append(doctypes[index])
+                attribute_string = attribute_strings[attribute_ids[index]]
+                if tag_class.have_children:
+                    parts.append(f"<{tag_class.tag_name}{attribute_string}>")
+                    if first_children[index] != NO_NODE:
+                        index = first_children[index]
+                        continue
+                    parts.append(tag_class._end_tag)
+                else:
+                    parts.append(f"<{tag_class.tag_name}{attribute_string} />")
+
+            # Climb up, closing every parent whose last child is done.
+            while index != root and next_siblings[index] == NO_NODE:
+                index = parents[index]
+                parts.append(tag_classes[tag_ids[index]]._end_tag)
+            if index == root:
+                return mark_safe("").join(parts)
+            index = next_siblings[index]
+
+    def to_element(self, root: int) -> BaseWebElement | SafeString:
+        root_element = self._new_element(root)
+        stack = [(root, root_element)]
+        while stack:
+            index, element = stack.pop()
+            if not isinstance(element, BaseWebElement):
+                continue
+
+            child_index = self.first_children[index]
+            if child_index != NO_NODE:
+                element._children = []
+            while child_index != NO_NODE:
+                child = self._new_element(child_index)
+                element._children.append(child)
+                stack.append((child_index, child))
+                child_index = self.next_siblings[child_index]
+        return root_element
+
+    def _new_element(self, index: int) -> BaseWebElement | SafeString:
+        # Attributes and texts are already validated and escaped, hence the
+        # elements are restored without going through their `__init__`.
+        tag_id = self.tag_ids[index]
+        if tag_id == NO_NODE:
+            return mark_safe(self.texts[self.text_ids[index]])
+
+        tag_class = self.tag_classes[tag_id]
+        element = tag_class.__new__(tag_class)
+        attributes = self.attributes[self.attribute_ids[index]]
+        element._attributes = (
+            AttributeDict(attributes) if attributes else EMPTY_ATTRIBUTES
+        )
+        if tag_class.have_children:
+            element._children = EMPTY_CHILDREN
+        element.escape_quote = self.escape_quotes[tag_id]
+        element._pending_validation = None
+        element._static_id = None
+        if issubclass(tag_class, Html):
+            doctype = self.doctypes.get(index)
+            element.doctype_value = (
+                doctype.removeprefix("<!DOCTYPE ").removesuffix(">") if doctype else ""
+            )
+        return element
@@ -1,13 +1,38 @@
-import re
+import asyncio
+import sys
+import threading
 import warnings
-from collections.abc import Generator, Iterable
+from collections import Counter
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Generator,
+    Iterable,
+    Iterator,
+)
 from enum import StrEnum
-from typing import Any, Generic, Self, TypedDict, TypeVar
+from functools import cache
+from inspect import get_annotations, isawaitable
+from types import MappingProxyType, NoneType
+from typing import Any, Generic, Self, TypedDict, TypeVar, get_args
 
 from pydantic import ConfigDict
+from pydantic import ValidationError as PydanticValidationError
 
-from .safe_string import safestring_escape
-from .utils import flatten_attributes, handle_exception
+from .errors import ValidationError
+from .safe_string import SafeString, safestring_escape
+from .utils import (
+    AttributeDict,
+    _flatten_attributes,
+    flatten_attributes,
+    format_validation_error_message,
+    handle_exception,
+    pop_pending_validation,
+    pre_escaped_attribute_keys,
+    static_subtree_cache,
+    validate_attribute_data,
+)
 
 
 class WebElementType(StrEnum):
@@ -20,71 +45,851 @@ class BaseAttribute(TypedDict):
     __pydantic_config__ = ConfigDict(extra="allow")
 
 
+class AttributeKeyNormalizer:
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self._normalized_keys: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def normalize(self, key: str) -> str:
+        if "_" not in key:
+            return key
+
+        normalized_key = self._normalized_keys.get(key)
+        if normalized_key is None:
+            normalized_key = key.removeprefix("_").replace("_", "-")
+            with self._lock:
+                if len(self._normalized_keys) < self.maxsize:
+                    self._normalized_keys[key] = normalized_key
+        return normalized_key
+
+    def seed(self, *attribute_classes: type) -> None:
+        # Declared attribute names are also rendered without being escaped.
+        for attribute_class in attribute_classes:
+            for key in attribute_class.__annotations__:
+                normalized_key = self.normalize(key)
+                if safestring_escape(normalized_key, True) == normalized_key:
+                    pre_escaped_attribute_keys.add(normalized_key)
+
+    def __len__(self) -> int:
+        return len(self._normalized_keys)
+
+
+attribute_key_normalizer = AttributeKeyNormalizer()
+
 T = TypeVar("T")
 
 
+_UNMATCHED = object()
+
+
+class ChildModel:
+    def __init__(
+        self,
+        allowed_types: tuple[type, ...] | None = None,
+        cardinality: dict[type, tuple[int, int | None]] | None = None,
+        categories_when_present: dict[type, tuple] | None = None,
+        counted_types: tuple[type, ...] = (),
+    ) -> None:
+        # `allowed_types` only restricts element children, text is always allowed.
+        self.allowed_types = allowed_types
+        self.cardinality = cardinality or {}
+        self.categories_when_present = categories_when_present or {}
+        self.counted_types = tuple(
+            dict.fromkeys(
+                (*self.cardinality, *self.categories_when_present, *counted_types)
+            )
+        )
+        self.matched_types_by_class: dict[type, tuple[type, ...] | None] = {}
+        # Iterators can only be kept lazy if nothing has to be known about the
+        # children up front (unlike cardinality or `_check_children` counts).
+        self.allows_lazy_children = not (self.cardinality or counted_types)
+
+    def match(self, child_class: type) -> tuple[type, ...] | None:
+        # The counted types a child class contributes to, `None` if it is not
+        # allowed at all. Cached per concrete class, for text children as well.
+        # Frozen elements are matched as the element they were rendered from.
+        element_class = child_class
+        if issubclass(child_class, FrozenElement):
+            element_class = child_class.element_class
+
+        if child_class is NoneType:
+            matched_types = None
+        elif not issubclass(element_class, BaseWebElement):
+            matched_types = ()
+        elif self.allowed_types is None or issubclass(
+            element_class, self.allowed_types
+        ):
+            matched_types = tuple(
+                counted_type
+                for counted_type in self.counted_types
+                if issubclass(element_class, counted_type)
+            )
+        else:
+            matched_types = None
+        self.matched_types_by_class[child_class] = matched_types
+        return matched_types
+
+    def check_lazy_child(self, element: "BaseWebElement", node: Any) -> None:
+        matched_types = self.matched_types_by_class.get(node.__class__, _UNMATCHED)
+        if matched_types is _UNMATCHED:
+            matched_types = self.match(node.__class__)
+
+        if matched_types is None:
+            raise ValueError(self.invalid_child_message(element.__class__))
+
+        for matched_type in matched_types:
+            for category in self.categories_when_present.get(matched_type, ()):
+                if category not in element.content_category:
+                    element.content_category += (category,)
+
+    def invalid_child_message(self, element_class: type) -> str:
+        allowed_type_names = ", ".join(
+            allowed_type.__qualname__ for allowed_type in (str, *self.allowed_types)
+        )
+        return f"Invalid child type found. `{element_class.__qualname__}` can only have {allowed_type_names}."
+
+    def check_cardinality(
+        self, element: "BaseWebElement", child_counts: dict[type, int]
+    ) -> None:
+        for child_type, (minimum, maximum) in self.cardinality.items():
+            count = child_counts[child_type]
+            if maximum is not None and count > maximum:
+                if maximum == 1:
+                    raise ValueError(
+                        f"Only one `{child_type.tag_name}` child is allowed in a `{element.__class__.__qualname__}` element. Found {count}."
+                    )
+                raise ValueError(
+                    f"At most {maximum} `{child_type.tag_name}` children are allowed in a `{element.__class__.__qualname__}` element. Found {count}."
+                )
+            if count < minimum:
+                if minimum == 1:
+                    raise ValueError(
+                        f"At least one `{child_type.tag_name}` child is required in a `{element.__class__.__qualname__}` element."
+                    )
+                raise ValueError(
+                    f"At least {minimum} `{child_type.tag_name}` children are required in a `{element.__class__.__qualname__}` element. Found {count}."
+                )
+
+
+# Shared by all elements until `attributes` (or `children`) is accessed from
+# outside, see `BaseWebElement.attributes`. Internally, `_attributes` and
+# `_children` are read as they are.
+EMPTY_ATTRIBUTES = MappingProxyType({})
+EMPTY_CHILDREN = ()
+
+
+class ContentCategory:
+    # Class-level `content_category` tuples are wrapped in this descriptor so
+    # that instances can still extend them (`+=`) without a `__dict__`.
+    def __init__(self, default: tuple | None) -> None:
+        self.default = default
+
+    def __get__(self, instance: Any, owner: type | None = None) -> tuple | None:
+        if instance is None:
+            return self.default
+        try:
+            return instance._content_category
+        except AttributeError:
+            return self.default
+
+    def __set__(self, instance: Any, value: tuple | None) -> None:
+        instance._content_category = value
+
+
 class BaseWebElement(Generic[T]):
+    __slots__ = (
+        "_attributes",
+        "_children",
+        "escape_quote",
+        "_content_category",
+        "_pending_validation",
+        "_static_id",
+    )
+
     web_element_type: WebElementType
     tag_name: str
     have_children: bool
     content_category: tuple[T] | None
+    child_model: ChildModel | None = None
+
+    # Rendered once per class by `__init_subclass__`.
+    _empty_start_tag: str
+    _end_tag: str
+    _default_attributes: dict[str, tuple[type, Any, str]] = EMPTY_ATTRIBUTES
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        content_category = cls.__dict__.get("content_category")
+        if not isinstance(content_category, ContentCategory) and (
+            "content_category" in cls.__dict__
+        ):
+            cls.content_category = ContentCategory(content_category)
+
+        tag_name = getattr(cls, "tag_name", None)
+        if tag_name is not None and hasattr(cls, "have_children"):
+            cls._empty_start_tag = sys.intern(
+                f"<{tag_name}>" if cls.have_children else f"<{tag_name} />"
+            )
+            cls._end_tag = sys.intern(f"</{tag_name}>")
+        cls._default_attributes = _get_default_attributes(cls)
 
     def __init__(self, escape_quote: bool = True, **attributes: dict) -> None:
-        self.attributes = {
-            re.sub(r"^_", "", key).replace("_", "-"): value
+        pending_validation = pop_pending_validation(attributes)
+        normalize = attribute_key_normalizer.normalize
+        attributes = {
+            normalize(key): value
             for key, value in attributes.items()
             if value is not None and (not isinstance(value, bool) or value)
         }
+        self._attributes = AttributeDict(attributes) if attributes else EMPTY_ATTRIBUTES
         if self.have_children:
-            self.children = []
+            self._children = EMPTY_CHILDREN
 
         self.escape_quote = escape_quote
+        self._pending_validation = pending_validation
+        # Elements with children get their id once they are called.
+        self._static_id = (
+            self._get_static_id()
+            if static_subtree_cache.maxsize and not self.have_children
+            else None
+        )
+
+    @property
+    def attributes(self) -> AttributeDict:
+        # The shared empty container is only swapped for the element's own one
+        # when it is accessed, so that it can be updated in place. The element
+        # may then change, hence it is no longer served from the static cache.
+        if self._attributes is EMPTY_ATTRIBUTES:
+            self._attributes = AttributeDict()
+        self._static_id = None
+        return self._attributes
+
+    @attributes.setter
+    def attributes(self, attributes: dict) -> None:
+        self._attributes = attributes
+        self._static_id = None
+
+    @property
+    def children(self) -> list:
+        if self._children is EMPTY_CHILDREN:
+            self._children = []
+        self._static_id = None
+        return self._children
+
+    @children.setter
+    def children(self, children: list) -> None:
+        self._children = children
+        self._static_id = None
 
     def __call__(self, *children: tuple) -> Self:
-        if self.have_children:
+        if self.have_children and self.child_model is not None:
+            self._attach_children(children, self.child_model)
+        elif self.have_children:
+            if children and self._children is EMPTY_CHILDREN:
+                self._children = []
+
             for child in children:
                 if (
                     isinstance(child, str)
                     or isinstance(child, BaseWebElement)
                     or not isinstance(child, Iterable)
                 ):
-                    self.children.append(child)
-                elif isinstance(child, Generator):
-                    self.children.extend(list(child))
+                    self._children.append(child)
+                elif isinstance(child, Iterator):
+                    self._children.append(LazyChildren(self, child))
                 elif isinstance(child, type(None)):
                     continue
                 else:
-                    self.children.extend(child)
+                    self._children.extend(child)
         else:
             warnings.warn(
                 f"Trying to add child to a non-child element: {self.__class__.__qualname__}",
                 UserWarning,
                 stacklevel=2,
             )
+
+        if self._static_id is not None or static_subtree_cache.maxsize:
+            self._static_id = self._get_static_id()
         return self
 
-    def render(self, stringify: bool = True) -> Generator[str, None, None]:
-        attribute_string = flatten_attributes(self.attributes)
-        attribute_string = (
-            (" " + attribute_string) if attribute_string else attribute_string
-        )
+    def _get_static_id(self) -> int | None:
+        # Elements made only of constant attributes and children render to the
+        # same output every time, they get an id from the static subtree cache
+        # (the same one for the same structure).
+        if (
+            not static_subtree_cache.maxsize
+            or self._pending_validation is not None
+            or not _is_static_class(self.__class__)
+        ):
+            return None
 
+        attributes = self._attributes
+        attribute_types = tuple(map(type, attributes.values()))
+        if not _STATIC_TYPES.issuperset(attribute_types):
+            return None
+
+        children_key = []
         if self.have_children:
-            yield f"<{self.tag_name}{attribute_string}>"
-            for child in self.children:
-                yield from _render_element(child, stringify, self.escape_quote)
-            yield f"</{self.tag_name}>"
+            for child in self._children:
+                if isinstance(child, BaseWebElement):
+                    if child._static_id is None:
+                        return None
+                    children_key.append(child._static_id)
+                elif type(child) in _STATIC_TYPES or isinstance(child, FrozenElement):
+                    children_key.append((type(child), child))
+                elif child is not None:
+                    return None
+
+        return static_subtree_cache.get_id(
+            (
+                self.__class__,
+                self.escape_quote,
+                tuple(attributes.items()),
+                attribute_types,
+                tuple(children_key),
+            )
+        )
+
+    def _attach_children(self, children: tuple, child_model: ChildModel) -> None:
+        # Children are flattened first, then checked and counted per distinct
+        # class (`Counter` does the per-child work in C) against the per-class
+        # match cache. They are only attached once the whole call is valid.
+        nodes = []
+        for child in children:
+            if (
+                isinstance(child, BaseWebElement)
+                or isinstance(child, str)
+                or not isinstance(child, Iterable)
+            ):
+                nodes.append(child)
+            elif isinstance(child, Iterator) and child_model.allows_lazy_children:
+                nodes.append(LazyChildren(self, child))
+            else:
+                nodes.extend(child)
+
+        child_counts = dict.fromkeys(child_model.counted_types, 0)
+        matched_types_by_class = child_model.matched_types_by_class
+        for node_class, count in Counter(map(type, nodes)).items():
+            matched_types = matched_types_by_class.get(node_class, _UNMATCHED)
+            if matched_types is _UNMATCHED:
+                matched_types = child_model.match(node_class)
+
+            if matched_types is None:
+                if node_class is not NoneType:
+                    raise ValueError(child_model.invalid_child_message(self.__class__))
+                nodes = [node for node in nodes if node is not None]
+                continue
+
+            for matched_type in matched_types:
+                child_counts[matched_type] += count
+
+        child_model.check_cardinality(self, child_counts)
+        self._check_children(child_counts)
+
+        for child_type, categories in child_model.categories_when_present.items():
+            if child_counts[child_type]:
+                for category in categories:
+                    if category not in self.content_category:
+                        self.content_category += (category,)
+
+        if self._children is EMPTY_CHILDREN:
+            self._children = nodes
         else:
-            yield f"<{self.tag_name}{attribute_string} />"
+            self._children.extend(nodes)
+
+    def _check_children(self, child_counts: dict[type, int]) -> None:
+        pass
+
+    def _apply_validated_attributes(self, validated_attributes: dict) -> None:
+        # Only values already present are updated, keys added or removed by the
+        # element itself (default `formtarget`, dropped `src`, ...) are kept.
+        normalize = attribute_key_normalizer.normalize
+        for key, value in validated_attributes.items():
+            normalized_key = normalize(key)
+            if normalized_key not in self._attributes:
+                continue
+            if value is None or value is False:
+                del self._attributes[normalized_key]
+            else:
+                self._attributes[normalized_key] = value
+
+    def render(self, stringify: bool = True) -> Generator[str, None, None]:
+        if self._static_id is not None and stringify and static_subtree_cache.maxsize:
+            yield _render_static(self)
+            return
+
+        yield from _render_tree(self, stringify)
+
+    def _render_start_tag(self) -> str:
+        attribute_string = flatten_attributes(
+            self._attributes, self._default_attributes
+        )
+        if not attribute_string:
+            return self._empty_start_tag
+        elif self.have_children:
+            return f"<{self.tag_name} {attribute_string}>"
+        return f"<{self.tag_name} {attribute_string} />"
+
+
+def _get_default_attributes(
+    element_class: type[BaseWebElement],
+) -> dict[str, tuple[type, Any, str]]:
+    # The defaults of the attribute `TypedDict` taken by the element's
+    # `__init__` (`**attributes: Unpack[...]`), each one rendered once. They are
+    # used for attributes that still have the same value (and type).
+    annotation = get_annotations(element_class.__init__).get("attributes")
+    attribute_class = next(iter(get_args(annotation)), None)
+    set_defaults = getattr(attribute_class, "set_defaults", None)
+    if set_defaults is None:
+        return EMPTY_ATTRIBUTES
+
+    default_attributes = {}
+    for key, value in set_defaults().items():
+        if value.__class__ not in (str, bool, int, float):
+            continue
+        key = attribute_key_normalizer.normalize(key)
+        attribute_string = _flatten_attributes({key: value})
+        if attribute_string:
+            default_attributes[key] = (value.__class__, value, attribute_string)
+    return default_attributes or EMPTY_ATTRIBUTES
+
 
+# Attribute values and text children that make an element static, the type is
+# part of the key as `1`, `1.0` and `True` compare equal but render differently.
+_STATIC_TYPES = frozenset((str, SafeString, bool, int, float))
 
-def _render_element(
-    element: Any, stringify: bool = True, escape_quote: bool = True
+
+@cache
+def _is_static_class(element_class: type[BaseWebElement]) -> bool:
+    # Elements with their own `render`, or with state beyond their attributes
+    # and children (`Html.doctype_value`, `Suspense.fallback`) are never static.
+    return element_class.render is BaseWebElement.render and not any(
+        getattr(klass, "__slots__", ())
+        for klass in element_class.__mro__
+        if klass is not BaseWebElement and issubclass(klass, BaseWebElement)
+    )
+
+
+def _render_static(element: BaseWebElement) -> str:
+    # Only the outermost static element of a subtree is stored, its static
+    # descendants are rendered in place (or served if already cached) by the
+    # same iterative walk. Output with a rendered error is never stored.
+    rendered = static_subtree_cache.get(element._static_id)
+    if rendered is None:
+        errors = []
+        rendered = "".join(_render_tree(element, errors=errors))
+        if not errors:
+            static_subtree_cache.set(element._static_id, rendered)
+    return rendered
+
+
+class Suspense(BaseWebElement):
+    # Its children are rendered in place by `render`. `arender` and
+    # `aiter_render` render the fallback in place instead, and stream the
+    # children once they are ready, see `_arender_tree`.
+    __slots__ = ("fallback",)
+
+    tag_name = "aether-suspense"
+    have_children = True
+    content_category = None
+
+    def __init__(self, fallback: Any = None) -> None:
+        super().__init__()
+        self.fallback = fallback
+
+
+class FrozenElement(SafeString):
+    # A subtree rendered once by `freeze`. Being a `SafeString`, it is emitted
+    # as is by every renderer. Each element class gets its own subclass (see
+    # `_get_frozen_class`), so that child models can still check it.
+    element_class: type[BaseWebElement] | None = None
+
+    def __new__(cls, value: str, encoded: bytes | None = None) -> Self:
+        frozen_element = super().__new__(cls, value)
+        frozen_element.encoded = encoded
+        return frozen_element
+
+    def render(self, stringify: bool = True) -> Generator[str, None, None]:
+        yield self
+
+
+@cache
+def _get_frozen_class(element_class: type[BaseWebElement]) -> type[FrozenElement]:
+    return type(
+        f"Frozen{element_class.__name__}",
+        (FrozenElement,),
+        {"element_class": element_class, "__module__": __name__},
+    )
+
+
+def freeze(element: BaseWebElement, encoding: str | None = None) -> FrozenElement:
+    value = "".join(element.render())
+    return _get_frozen_class(element.__class__)(
+        value, value.encode(encoding) if encoding else None
+    )
+
+
+class LazyChildren:
+    # Generator/iterator children are only consumed, and type-checked, while
+    # the parent is rendered. Hence they can be rendered only once.
+    def __init__(self, parent: BaseWebElement, iterator: Iterator) -> None:
+        self.parent = parent
+        self.iterator = iterator
+        self.consumed = False
+
+    def __iter__(self) -> Generator[Any, None, None]:
+        if self.consumed:
+            raise RuntimeError(
+                f"Lazy children of `{self.parent.__class__.__qualname__}` have already been consumed by a previous render."
+            )
+        self.consumed = True
+
+        child_model = self.parent.child_model
+        for node in self.iterator:
+            if node is None:
+                continue
+            if child_model is not None:
+                child_model.check_lazy_child(self.parent, node)
+            yield node
+
+
+def _format_element_path(path: tuple) -> str:
+    labels = []
+    while path is not None:
+        path, element, index = path
+        label = element.__class__.__qualname__
+        labels.append(label if index is None else f"{label}[{index}]")
+    return " > ".join(reversed(labels))
+
+
+def validate_tree(root: BaseWebElement, warn_lazy: bool = True) -> None:
+    pending_elements: dict[type, list[tuple[BaseWebElement, tuple]]] = {}
+    stack = [(root, (None, root, None))]
+    while stack:
+        element, path = stack.pop()
+        if element._pending_validation is not None:
+            pending_elements.setdefault(element._pending_validation.cls, []).append(
+                (element, path)
+            )
+
+        if element.have_children:
+            # Pushed in reverse so that elements are visited in document order.
+            for index in range(len(element._children) - 1, -1, -1):
+                child = element._children[index]
+                if isinstance(child, BaseWebElement):
+                    stack.append((child, (path, child, index)))
+                elif warn_lazy and isinstance(child, LazyChildren):
+                    warnings.warn(
+                        f"Lazy children of `{_format_element_path(path)}` can not be validated before they are rendered, pass a list to validate them.",
+                        UserWarning,
+                        stacklevel=2,
+                    )
+
+    error_messages = []
+    for attribute_class, elements in pending_elements.items():
+        for element, path in elements:
+            _, data, custom_validators = element._pending_validation
+            try:
+                validated_attributes = validate_attribute_data(
+                    attribute_class, data, custom_validators
+                )
+            except (ValidationError, PydanticValidationError) as err:
+                error_messages.append(
+                    f"{_format_element_path(path)}:\n{format_validation_error_message(err)}"
+                )
+            else:
+                element._pending_validation = None
+                element._apply_validated_attributes(validated_attributes)
+
+    if error_messages:
+        raise ValueError("\n".join(error_messages))
+
+
+def _render_tree(
+    root: BaseWebElement, stringify: bool = True, errors: list | None = None
 ) -> Generator[str, None, None]:
+    # Walks the tree with an explicit stack instead of one nested generator per
+    # element, each frame being the children iterator of an open element (or of
+    # lazy children) along with what to emit once it is exhausted.
+    # Errors are rendered in place of the child that raised them, and the rest
+    # of a failing lazy iterator is skipped. They are also appended to `errors`
+    # when it is given, static elements are then rendered without being stored.
+    base_render = BaseWebElement.render
+    if errors is None:
+        handle = handle_exception
+    else:
+
+        def handle(exception: Exception) -> Generator[str, None, None]:
+            errors.append(exception)
+            return handle_exception(exception)
+
+    # Deferred records are validated in a single pass over the whole tree the
+    # first time one is met, and its errors propagate as with eager validation.
+    # Only elements coming from lazy children can be left afterwards, each one
+    # is validated on its own and an error is rendered in its place.
+    tree_validated = root._pending_validation is not None
+    if tree_validated:
+        validate_tree(root, warn_lazy=False)
+    validation_error = None
+
+    yield root._render_start_tag()
+    if not root.have_children:
+        return
+
+    stack = [(iter(root._children), root.escape_quote, root._end_tag)]
+    while stack:
+        children, escape_quote, end = stack[-1]
+        try:
+            for child in children:
+                if isinstance(child, BaseWebElement):
+                    if child.__class__.render is not base_render:
+                        # Elements with their own `render` are delegated to.
+                        try:
+                            yield from child.render(stringify=stringify)
+                        except Exception as e:
+                            yield from handle(e)
+                        continue
+
+                    if child._pending_validation is not None and not tree_validated:
+                        tree_validated = True
+                        try:
+                            validate_tree(root, warn_lazy=False)
+                        except ValueError as e:
+                            # Raised below, out of the lazy children handler.
+                            validation_error = e
+                            break
+
+                    try:
+                        if (
+                            child._static_id is not None
+                            and stringify
+                            and static_subtree_cache.maxsize
+                        ):
+                            if errors is None:
+                                yield _render_static(child)
+                                continue
+                            rendered = static_subtree_cache.get(child._static_id)
+                            if rendered is not None:
+                                yield rendered
+                                continue
+
+                        if child._pending_validation is not None:
+                            validate_tree(child, warn_lazy=False)
+                        start_tag = child._render_start_tag()
+                    except Exception as e:
+                        yield from handle(e)
+                        continue
+
+                    yield start_tag
+                    if child.have_children:
+                        stack.append(
+                            (
+                                iter(child._children),
+                                child.escape_quote,
+                                child._end_tag,
+                            )
+                        )
+                        break
+                elif isinstance(child, LazyChildren):
+                    stack.append((iter(child), escape_quote, None))
+                    break
+                elif child is not None:
+                    if not stringify:
+                        yield child
+                        continue
+                    try:
+                        if not isinstance(child, str) and _is_async_child(child):
+                            raise TypeError(
+                                "Awaitable and async iterator children can only be rendered with `aether.arender` or `aether.aiter_render`."
+                            )
+                        text = safestring_escape(child, escape_quote)
+                    except Exception as e:
+                        yield from handle(e)
+                        continue
+                    yield text
+            else:
+                stack.pop()
+                if end is not None:
+                    yield end
+        except Exception as e:
+            # Everything else is handled above, only lazy children can fail
+            # while being iterated.
+            stack.pop()
+            yield from handle(e)
+        if validation_error is not None:
+            raise validation_error
+
+
+def _is_async_child(child: Any) -> bool:
+    return isawaitable(child) or isinstance(child, AsyncIterable)
+
+
+async def _arender_tree(
+    root: BaseWebElement,
+    suspended: list[asyncio.Task] | None = None,
+    errors: list | None = None,
+) -> AsyncGenerator[str | None, None]:
+    # Async counterpart of `_render_tree`. Awaitables are awaited and async
+    # iterators consumed in document order, where they stand in the tree, and
+    # `None` is yielded right before waiting so that callers can flush the
+    # content that is already rendered.
+    # When a `suspended` list is given, `Suspense` elements only render their
+    # fallback, their children are rendered concurrently by the tasks appended
+    # to the list (see `_render_suspended`). Errors are collected into `errors`
+    # as by `_render_tree`.
+    base_render = BaseWebElement.render
+    if errors is None:
+        handle = handle_exception
+    else:
+
+        def handle(exception: Exception) -> Generator[str, None, None]:
+            errors.append(exception)
+            return handle_exception(exception)
+
+    # Deferred records are validated as by `_render_tree`.
+    tree_validated = root._pending_validation is not None
+    if tree_validated:
+        validate_tree(root, warn_lazy=False)
+    yield root._render_start_tag()
+    if not root.have_children:
+        return
+
+    stack = [(iter(root._children), root, root._end_tag)]
+    while stack:
+        children, parent, end = stack[-1]
+        try:
+            if isinstance(children, AsyncIterator):
+                yield None
+                child = await anext(children, _UNMATCHED)
+            else:
+                child = next(children, _UNMATCHED)
+        except Exception as e:
+            # Only lazy (and async) children can fail while being iterated.
+            stack.pop()
+            for fragment in handle(e):
+                yield fragment
+            continue
+
+        if child is _UNMATCHED:
+            stack.pop()
+            if end is not None:
+                yield end
+            continue
+
+        if isawaitable(child):
+            yield None
+            try:
+                child = await child
+            except Exception as e:
+                for fragment in handle(e):
+                    yield fragment
+                continue
+
+            # The result stands in for the awaitable, lists included.
+            if (
+                isinstance(child, BaseWebElement | str)
+                or isawaitable(child)
+                or not isinstance(child, Iterable | AsyncIterable)
+            ):
+                child = (child,)
+            stack.append(
+                (
+                    aiter(child) if isinstance(child, AsyncIterable) else iter(child),
+                    parent,
+                    None,
+                )
+            )
+            continue
+
+        if child is None:
+            continue
+
+        if suspended is not None and isinstance(child, Suspense):
+            suspense_id = f"aether-suspense-{len(suspended)}"
+            suspended.append(
+                asyncio.ensure_future(_render_suspended(child, suspense_id))
+            )
+            yield f'<{child.tag_name} id="{suspense_id}">'
+            stack.append(
+                (
+                    iter((child.fallback,)),
+                    child,
+                    child._end_tag,
+                )
+            )
+            continue
+
+        if isinstance(child, BaseWebElement):
+            if child._pending_validation is not None and not tree_validated:
+                validate_tree(root, warn_lazy=False)
+                tree_validated = True
+
+            try:
+                # Children coming from awaitables and async iterators have not
+                # been type-checked when they were attached.
+                if end is None and parent.child_model is not None:
+                    parent.child_model.check_lazy_child(parent, child)
+                if child.__class__.render is not base_render:
+                    for fragment in child.render():
+                        yield fragment
+                    continue
+
+                if child._static_id is not None and static_subtree_cache.maxsize:
+                    if errors is None:
+                        yield _render_static(child)
+                        continue
+                    rendered = static_subtree_cache.get(child._static_id)
+                    if rendered is not None:
+                        yield rendered
+                        continue
+
+                if child._pending_validation is not None:
+                    validate_tree(child, warn_lazy=False)
+                start_tag = child._render_start_tag()
+            except Exception as e:
+                for fragment in handle(e):
+                    yield fragment
+                continue
+
+            yield start_tag
+            if child.have_children:
+                stack.append((iter(child._children), child, child._end_tag))
+        elif isinstance(child, LazyChildren):
+            stack.append((iter(child), parent, None))
+        elif isinstance(child, AsyncIterable):
+            stack.append((aiter(child), parent, None))
+        else:
+            try:
+                text = safestring_escape(child, parent.escape_quote)
+            except Exception as e:
+                for fragment in handle(e):
+                    yield fragment
+                continue
+            yield text
+
+
+async def _render_suspended(suspense: Suspense, suspense_id: str) -> str:
+    # Nested `Suspense` elements are rendered in place, as their placeholders
+    # would only exist once this content has been swapped in.
     try:
-        if isinstance(element, BaseWebElement):
-            yield from element.render(stringify=stringify)
-        elif element is not None:
-            yield safestring_escape(element, escape_quote) if stringify else element
-    except (Exception, RuntimeError) as e:
-        yield from handle_exception(e)
+        fragments = [
+            fragment
+            async for fragment in _arender_tree(suspense)
+            if fragment is not None
+        ]
+        # The placeholder is kept, only its fallback gets replaced, hence the
+        # same DOM as with `render`.
+        content = "".join(fragments[1:-1])
+    except Exception as e:
+        content = "".join(handle_exception(e))
+
+    return (
+        f'<template id="{suspense_id}-content">{content}</template>'
+        "<script>"
+        "(function(t){"
+        f'document.getElementById("{suspense_id}").replaceChildren(t.content);'
+        "t.remove()"
+        f'}})(document.getElementById("{suspense_id}-content"))'
+        "</script>"
+    )
@@ -0,0 +1,518 @@
+import asyncio
+import contextvars
+import inspect
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import wraps
+from typing import Any, NamedTuple, ParamSpec
+
+from .base import (
+    BaseWebElement,
+    FrozenElement,
+    _arender_tree,
+    _get_frozen_class,
+    _render_tree,
+)
+
+P = ParamSpec("P")
+
+
+class FragmentCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    coalesced: int
+    stale_hits: int
+    refreshes: int
+    refresh_errors: int
+    average_refresh_time: float
+    max_refresh_time: float
+    maxsize: int
+    currsize: int
+
+
+class _Entry(NamedTuple):
+    value: FrozenElement
+    expires_at: float | None
+    stale_at: float | None
+    tags: frozenset[str]
+
+
+_refresh_executor: ThreadPoolExecutor | None = None
+_refresh_executor_lock = threading.Lock()
+_refresh_tasks: set[asyncio.Task] = set()
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    global _refresh_executor
+    with _refresh_executor_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(
+                thread_name_prefix="aether-fragment-refresh"
+            )
+        return _refresh_executor
+
+
+class FragmentCache:
+    # Entries expire after `ttl` seconds. Past `soft_ttl` seconds, they are
+    # still served while a refresh runs in the background, on `executor` (a
+    # shared thread pool by default) or on the running loop for async renders.
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float | None = None,
+        soft_ttl: float | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.soft_ttl = soft_ttl
+        self.executor = executor
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._keys_by_tag: dict[str, set[Hashable]] = {}
+        self._in_flight: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._coalesced = 0
+        self._stale_hits = 0
+        self._refreshes = 0
+        self._refresh_errors = 0
+        self._refresh_time = 0.0
+        self._max_refresh_time = 0.0
+        _fragment_caches.add(self)
+
+    def _lookup(self, key: Hashable) -> _Entry | None:
+        entry = self._entries.get(key)
+        if entry is not None and (
+            entry.expires_at is not None and entry.expires_at <= time.monotonic()
+        ):
+            self._remove(key)
+            self._evictions += 1
+            entry = None
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def get(self, key: Hashable) -> FrozenElement | None:
+        with self._lock:
+            entry = self._lookup(key)
+            return entry.value if entry is not None else None
+
+    def _start_flight(self, key: Hashable) -> Future:
+        future = self._in_flight[key] = Future()
+        # A running future can not be cancelled by a waiter giving up.
+        future.set_running_or_notify_cancel()
+        return future
+
+    def _join_flight(
+        self, key: Hashable
+    ) -> tuple[FrozenElement | None, Future | None, bool]:
+        # Either the cached fragment, or the future of the render in flight for
+        # `key`, and whether the caller is the one that has to render it (in
+        # the background when the fragment is stale).
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None:
+                if entry.stale_at is None or entry.stale_at > time.monotonic():
+                    return entry.value, None, False
+
+                self._stale_hits += 1
+                if key in self._in_flight:
+                    return entry.value, None, False
+                return entry.value, self._start_flight(key), True
+
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._coalesced += 1
+                return None, future, False
+            return None, self._start_flight(key), True
+
+    def _land_flight(
+        self,
+        key: Hashable,
+        future: Future,
+        fragment: FrozenElement | None,
+        tags: Callable[[], Iterable[str]],
+    ) -> None:
+        with self._lock:
+            landed = self._in_flight.get(key) is future
+            if landed:
+                del self._in_flight[key]
+        # Renders overtaken by an invalidation, or with a rendered error, are
+        # handed to their waiters but not stored.
+        if (
+            landed
+            and fragment is not None
+            and not getattr(fragment, "render_errors", None)
+        ):
+            self.set(key, fragment, tags())
+
+    def get_or_render(
+        self,
+        key: Hashable,
+        render: Callable[[], FrozenElement],
+        tags: Callable[[], Iterable[str]] = tuple,
+        timeout: float | None = None,
+    ) -> FrozenElement:
+        # Concurrent misses for the same key wait for a single render, or
+        # render on their own after `timeout` seconds (or if it fails).
+        fragment, future, leader = self._join_flight(key)
+        if fragment is not None:
+            if leader:
+                executor = self.executor or _get_refresh_executor()
+                try:
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        self._refresh,
+                        key,
+                        future,
+                        render,
+                        tags,
+                    )
+                except Exception as error:
+                    # E.g. a shut down executor, the stale fragment is served
+                    # and the next stale hit tries again.
+                    future.set_exception(error)
+                    self._land_flight(key, future, None, tags)
+                    self._record_refresh(time.perf_counter(), failed=True)
+            return fragment
+        elif not leader:
+            try:
+                return future.result(timeout)
+            except Exception:
+                return render()
+        return self._render_flight(key, future, render, tags)
+
+    def _render_flight(
+        self,
+        key: Hashable,
+        future: Future,
+        render: Callable[[], FrozenElement],
+        tags: Callable[[], Iterable[str]],
+    ) -> FrozenElement:
+        fragment = None
+        try:
+            fragment = render()
+            future.set_result(fragment)
+            return fragment
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        finally:
+            self._land_flight(key, future, fragment, tags)
+
+    def _refresh(
+        self,
+        key: Hashable,
+        future: Future,
+        render: Callable[[], FrozenElement],
+        tags: Callable[[], Iterable[str]],
+    ) -> None:
+        # The stale entry is kept (until it expires) if the refresh fails, or
+        # renders an error.
+        start = time.perf_counter()
+        try:
+            fragment = self._render_flight(key, future, render, tags)
+        except Exception:
+            self._record_refresh(start, failed=True)
+        else:
+            self._record_refresh(
+                start, failed=bool(getattr(fragment, "render_errors", None))
+            )
+
+    async def aget_or_render(
+        self,
+        key: Hashable,
+        render: Callable[[], Awaitable[FrozenElement]],
+        tags: Callable[[], Iterable[str]] = tuple,
+        timeout: float | None = None,
+    ) -> FrozenElement:
+        # Same as `get_or_render`, waiting without blocking the event loop.
+        fragment, future, leader = self._join_flight(key)
+        if fragment is not None:
+            if leader:
+                task = asyncio.get_running_loop().create_task(
+                    self._arefresh(key, future, render, tags)
+                )
+                _refresh_tasks.add(task)
+                task.add_done_callback(_refresh_tasks.discard)
+            return fragment
+        elif not leader:
+            try:
+                return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+            except Exception:
+                return await render()
+        return await self._arender_flight(key, future, render, tags)
+
+    async def _arender_flight(
+        self,
+        key: Hashable,
+        future: Future,
+        render: Callable[[], Awaitable[FrozenElement]],
+        tags: Callable[[], Iterable[str]],
+    ) -> FrozenElement:
+        fragment = None
+        try:
+            fragment = await render()
+            future.set_result(fragment)
+            return fragment
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        finally:
+            self._land_flight(key, future, fragment, tags)
+
+    async def _arefresh(
+        self,
+        key: Hashable,
+        future: Future,
+        render: Callable[[], Awaitable[FrozenElement]],
+        tags: Callable[[], Iterable[str]],
+    ) -> None:
+        start = time.perf_counter()
+        try:
+            fragment = await self._arender_flight(key, future, render, tags)
+        except Exception:
+            self._record_refresh(start, failed=True)
+        else:
+            self._record_refresh(
+                start, failed=bool(getattr(fragment, "render_errors", None))
+            )
+
+    def _record_refresh(self, start: float, failed: bool = False) -> None:
+        duration = time.perf_counter() - start
+        with self._lock:
+            self._refreshes += 1
+            self._refresh_errors += failed
+            self._refresh_time += duration
+            self._max_refresh_time = max(self._max_refresh_time, duration)
+
+    def set(
+        self,
+        key: Hashable,
+        value: FrozenElement,
+        tags: Iterable[str] = (),
+        ttl: float | None = None,
+        soft_ttl: float | None = None,
+    ) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        soft_ttl = self.soft_ttl if soft_ttl is None else soft_ttl
+        now = time.monotonic()
+        expires_at = now + ttl if ttl is not None else None
+        stale_at = now + soft_ttl if soft_ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            entry = self._entries[key] = _Entry(
+                value, expires_at, stale_at, frozenset(tags)
+            )
+            for tag in entry.tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        for tag in entry.tags:
+            keys = self._keys_by_tag[tag]
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_tag[tag]
+
+    def invalidate(self, key: Hashable) -> bool:
+        with self._lock:
+            self._in_flight.pop(key, None)
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def invalidate_tag(self, tag: str) -> int:
+        with self._lock:
+            # The tags of renders in flight are not known yet.
+            self._in_flight.clear()
+            keys = list(self._keys_by_tag.get(tag, ()))
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def info(self) -> FragmentCacheInfo:
+        with self._lock:
+            return FragmentCacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._coalesced,
+                self._stale_hits,
+                self._refreshes,
+                self._refresh_errors,
+                self._refresh_time / self._refreshes if self._refreshes else 0.0,
+                self._max_refresh_time,
+                self.maxsize,
+                len(self._entries),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_tag.clear()
+            self._in_flight.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._coalesced = 0
+            self._stale_hits = 0
+            self._refreshes = 0
+            self._refresh_errors = 0
+            self._refresh_time = 0.0
+            self._max_refresh_time = 0.0
+
+
+_fragment_caches: weakref.WeakSet[FragmentCache] = weakref.WeakSet()
+
+
+def invalidate_tag(tag: str) -> int:
+    # Drops the entries tagged with `tag` from every fragment cache.
+    return sum(cache.invalidate_tag(tag) for cache in list(_fragment_caches))
+
+
+def _make_key(args: tuple, kwargs: dict) -> Hashable:
+    # The argument types are part of the key as `1`, `1.0` and `True` compare
+    # equal but do not render the same.
+    key = (
+        tuple((type(value), value) for value in args),
+        tuple((key, type(value), value) for key, value in sorted(kwargs.items())),
+    )
+    hash(key)
+    return key
+
+
+def render_fragment(element: BaseWebElement | FrozenElement) -> FrozenElement:
+    # Rendered once and kept as a `FrozenElement`, so that it is inserted as is
+    # (without being escaped again) and still type-checked as a child.
+    # Fragments with a rendered error keep the errors, they are not stored.
+    if isinstance(element, FrozenElement):
+        return element
+    errors = []
+    if element.__class__.render is BaseWebElement.render:
+        rendered = "".join(_render_tree(element, errors=errors))
+    else:
+        rendered = "".join(element.render())
+    return _new_fragment(element, rendered, errors)
+
+
+async def arender_fragment(element: BaseWebElement | FrozenElement) -> FrozenElement:
+    if isinstance(element, FrozenElement):
+        return element
+    errors = []
+    if element.__class__.render is BaseWebElement.render:
+        fragments = _arender_tree(element, errors=errors)
+        rendered = "".join([fragment async for fragment in fragments if fragment])
+    else:
+        rendered = "".join(element.render())
+    return _new_fragment(element, rendered, errors)
+
+
+def _new_fragment(
+    element: BaseWebElement, rendered: str, errors: list
+) -> FrozenElement:
+    fragment = _get_frozen_class(element.__class__)(rendered)
+    if errors:
+        fragment.render_errors = errors
+    return fragment
+
+
+def cached_fragment(
+    function: Callable[P, BaseWebElement] | None = None,
+    *,
+    maxsize: int = 1024,
+    ttl: float | None = None,
+    soft_ttl: float | None = None,
+    key: Callable[..., Hashable] | None = None,
+    tags: Iterable[str] | Callable[..., Iterable[str]] = (),
+    wait_timeout: float | None = 5.0,
+    refresh_executor: Executor | None = None,
+) -> Any:
+    # The key defaults to the (hashable) arguments, calls with unhashable
+    # arguments are rendered without the cache. `tags`, or the tags returned
+    # for the call's arguments, allow invalidating entries by group.
+    # Concurrent misses for a key are rendered once, callers waiting longer
+    # than `wait_timeout` seconds render on their own. Fragments older than
+    # `soft_ttl` are served stale while they are refreshed in the background.
+    # Coroutine functions are awaited and rendered with `aether.arender`.
+    def decorator(function: Callable[P, BaseWebElement]) -> Any:
+        cache = FragmentCache(maxsize, ttl, soft_ttl, refresh_executor)
+
+        def get_key(*args: Any, **kwargs: Any) -> Hashable | None:
+            try:
+                return (
+                    key(*args, **kwargs) if key is not None else _make_key(args, kwargs)
+                )
+            except TypeError:
+                return None
+
+        def get_tags(*args: Any, **kwargs: Any) -> Iterable[str]:
+            return tags(*args, **kwargs) if callable(tags) else tags
+
+        if inspect.iscoroutinefunction(function):
+
+            @wraps(function)
+            async def render_cached(*args: P.args, **kwargs: P.kwargs) -> FrozenElement:
+                async def render() -> FrozenElement:
+                    return await arender_fragment(await function(*args, **kwargs))
+
+                cache_key = get_key(*args, **kwargs)
+                if cache_key is None:
+                    return await render()
+                return await cache.aget_or_render(
+                    cache_key,
+                    render,
+                    lambda: get_tags(*args, **kwargs),
+                    wait_timeout,
+                )
+
+        else:
+
+            @wraps(function)
+            def render_cached(*args: P.args, **kwargs: P.kwargs) -> FrozenElement:
+                def render() -> FrozenElement:
+                    return render_fragment(function(*args, **kwargs))
+
+                cache_key = get_key(*args, **kwargs)
+                if cache_key is None:
+                    return render()
+                return cache.get_or_render(
+                    cache_key,
+                    render,
+                    lambda: get_tags(*args, **kwargs),
+                    wait_timeout,
+                )
+
+        def invalidate(*args: Any, **kwargs: Any) -> bool:
+            cache_key = get_key(*args, **kwargs)
+            return cache_key is not None and cache.invalidate(cache_key)
+
+        render_cached.cache = cache
+        render_cached.invalidate = invalidate
+        render_cached.invalidate_key = cache.invalidate
+        render_cached.invalidate_tag = cache.invalidate_tag
+        render_cached.cache_info = cache.info
+        render_cached.cache_clear = cache.clear
+        return render_cached
+
+    if function is not None:
+        return decorator(function)
+    return decorator
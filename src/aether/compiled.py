@@ -0,0 +1,275 @@
+import inspect
+import re
+import sys
+import threading
+from collections.abc import Callable, Iterable
+from functools import wraps
+from html import escape as escape_html
+from typing import Any, NamedTuple, ParamSpec
+
+from .base import BaseWebElement, FrozenElement, _get_frozen_class
+from .safe_string import safestring_escape
+from .utils import is_trusted_mode, trusted_mode
+
+P = ParamSpec("P")
+
+
+class _DataDependentStructure(BaseException):
+    # A `BaseException` so that renderers do not turn it into an error message
+    # in place of the child, the trace has to be abandoned.
+    pass
+
+
+# Placeholders render to `\x00<kind><index><"\x00`, the way `<"` comes out
+# tells how the placeholder was escaped, hence how its value has to be.
+_PLACEHOLDER_PATTERN = re.compile(
+    r'(?: ([^\s"\'<>/=\x00]+)="\x00s(\d+)&lt;&quot;\x00")'
+    r'|\x00([sf])(\d+)(&lt;&quot;|&lt;"|<")\x00'
+)
+
+
+class _Placeholder(str):
+    # Stands in for a component argument while the component is traced. It
+    # records attribute, item and method accesses, renders to a token, and
+    # refuses everything that would let the data shape the structure.
+    def __new__(cls, placeholders: list, name: str, operations: tuple = ()):
+        index = len(placeholders)
+        placeholder = super().__new__(cls, f'\x00s{index}<"\x00')
+        object.__setattr__(placeholder, "_placeholders", placeholders)
+        object.__setattr__(placeholder, "_name", name)
+        object.__setattr__(placeholder, "_operations", operations)
+        object.__setattr__(placeholder, "_index", index)
+        placeholders.append(placeholder)
+        return placeholder
+
+    def _derive(self, operation: tuple) -> "_Placeholder":
+        get = object.__getattribute__
+        return _Placeholder(
+            get(self, "_placeholders"),
+            get(self, "_name"),
+            (*get(self, "_operations"), operation),
+        )
+
+    def __getattribute__(self, name: str) -> Any:
+        if name.startswith("__"):
+            return object.__getattribute__(self, name)
+        if name.startswith("_"):
+            raise _DataDependentStructure(name)
+        return object.__getattribute__(self, "_derive")(("getattr", name))
+
+    def __getattr__(self, name: str) -> Any:
+        raise AttributeError(name)
+
+    def __getitem__(self, key: Any) -> "_Placeholder":
+        if isinstance(key, _Placeholder):
+            raise _DataDependentStructure("[]")
+        return object.__getattribute__(self, "_derive")(("getitem", key))
+
+    def __call__(self, *args: Any, **kwargs: Any) -> "_Placeholder":
+        if any(isinstance(value, _Placeholder) for value in (*args, *kwargs.values())):
+            raise _DataDependentStructure("()")
+        return object.__getattribute__(self, "_derive")(("call", args, kwargs))
+
+    def __str__(self) -> str:
+        return str.__str__(self)
+
+    def __format__(self, format_spec: str) -> str:
+        if format_spec:
+            raise _DataDependentStructure("format")
+        return f'\x00f{object.__getattribute__(self, "_index")}<"\x00'
+
+    def _refuse(self, *args: Any, **kwargs: Any) -> Any:
+        raise _DataDependentStructure("operation")
+
+    __bool__ = __len__ = __iter__ = __contains__ = __hash__ = _refuse
+    __eq__ = __ne__ = __lt__ = __le__ = __gt__ = __ge__ = _refuse
+    __mul__ = __rmul__ = __mod__ = __rmod__ = __radd__ = __repr__ = _refuse
+
+
+def _evaluate(arguments: dict, name: str, operations: tuple) -> Any:
+    value = arguments[name]
+    for operation in operations:
+        if operation[0] == "getattr":
+            value = getattr(value, operation[1])
+        elif operation[0] == "getitem":
+            value = value[operation[1]]
+        else:
+            value = value(*operation[1], **operation[2])
+    return value
+
+
+def _render_child_value(value: Any, escape_quote: bool) -> str:
+    # What rendering `value` as a child yields.
+    if value is None:
+        return ""
+    elif isinstance(value, BaseWebElement):
+        return "".join(value.render())
+    elif isinstance(value, str) or not isinstance(value, Iterable):
+        return safestring_escape(value, escape_quote)
+    return "".join(_render_child_value(node, escape_quote) for node in value)
+
+
+def _render_attribute_value(key: str, value: Any) -> str:
+    # What `flatten_attributes` makes of the attribute. Tags may add or drop
+    # other attributes depending on whether a value is `None` (or a boolean),
+    # which placeholders can not record, such values are rendered normally.
+    if value is None or value.__class__ is bool:
+        raise _DataDependentStructure(key)
+    return f' {safestring_escape(key, True)}="{safestring_escape(value, True)}"'
+
+
+class _Slot(NamedTuple):
+    name: str
+    operations: tuple
+    kind: str
+    escape_quote: bool | None
+    attribute_key: str | None
+
+    def render(self, arguments: dict) -> str:
+        value = _evaluate(arguments, self.name, self.operations)
+        if self.attribute_key is not None:
+            return _render_attribute_value(self.attribute_key, value)
+        elif self.kind == "s" and self.escape_quote is not None:
+            return _render_child_value(value, self.escape_quote)
+
+        text = format(value) if self.kind == "f" else str(value)
+        if self.escape_quote is None:
+            return text
+        return escape_html(text, quote=self.escape_quote)
+
+
+def _compile_segments(
+    rendered: str, placeholders: list[_Placeholder]
+) -> list[str | _Slot] | None:
+    segments: list[str | _Slot] = []
+    position = 0
+    for match in _PLACEHOLDER_PATTERN.finditer(rendered):
+        static_segment = rendered[position : match.start()]
+        if "\x00" in static_segment:
+            return None
+        if static_segment:
+            segments.append(sys.intern(static_segment))
+        position = match.end()
+
+        attribute_key, attribute_index, kind, index, context = match.groups()
+        placeholder = placeholders[int(attribute_index or index)]
+        get = object.__getattribute__
+        segments.append(
+            _Slot(
+                get(placeholder, "_name"),
+                get(placeholder, "_operations"),
+                kind or "s",
+                {"&lt;&quot;": True, '&lt;"': False, '<"': None}.get(context, True),
+                attribute_key,
+            )
+        )
+
+    static_segment = rendered[position:]
+    if "\x00" in static_segment:
+        return None
+    if static_segment:
+        segments.append(sys.intern(static_segment))
+    return segments
+
+
+class TracedComponent(NamedTuple):
+    element_class: type[BaseWebElement]
+    segments: list[str | _Slot]
+
+
+def trace_component(function: Callable) -> TracedComponent | None:
+    # Calls the component with placeholder arguments and splits its output into
+    # static segments and slots, `None` if its structure depends on the data.
+    signature = inspect.signature(function)
+    if any(
+        parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD)
+        for parameter in signature.parameters.values()
+    ):
+        return None
+
+    placeholders: list[_Placeholder] = []
+    arguments = {
+        name: _Placeholder(placeholders, name) for name in signature.parameters
+    }
+    try:
+        with trusted_mode():
+            element = function(**arguments)
+            if not isinstance(element, BaseWebElement):
+                return None
+            rendered = "".join(element.render())
+    except (Exception, _DataDependentStructure):
+        return None
+
+    segments = _compile_segments(rendered, placeholders)
+    if segments is None:
+        return None
+    return TracedComponent(element.__class__, segments)
+
+
+def compiled_component(
+    function: Callable[P, BaseWebElement],
+) -> Callable[P, BaseWebElement | FrozenElement]:
+    # The component is traced once, on its first call, and later calls only
+    # render their arguments into the slots, returning a `FrozenElement`.
+    # Components whose structure depends on their arguments (conditions, loops,
+    # comparisons...) are called and rendered normally instead, as are those
+    # whose first compiled output differs from the normal one.
+    # Slot values are not validated, hence the compiled output is only used in
+    # trusted mode, the component is called normally otherwise, as it is for
+    # attribute values that are `None` or booleans.
+    signature = inspect.signature(function)
+    parameter_names = tuple(signature.parameters)
+    positional = all(
+        parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+        for parameter in signature.parameters.values()
+    )
+    lock = threading.Lock()
+    state: dict[str, Any] = {"segments": None, "verified": False, "fallback": False}
+
+    def compile_function() -> None:
+        traced_component = trace_component(function)
+        if traced_component is None:
+            state["fallback"] = True
+            return
+        state["segments"] = traced_component.segments
+        state["frozen_class"] = _get_frozen_class(traced_component.element_class)
+
+    @wraps(function)
+    def render_component(*args: P.args, **kwargs: P.kwargs):
+        if not is_trusted_mode():
+            return function(*args, **kwargs)
+        if state["segments"] is None and not state["fallback"]:
+            with lock:
+                if state["segments"] is None and not state["fallback"]:
+                    compile_function()
+        if state["fallback"]:
+            return function(*args, **kwargs)
+
+        if positional and not kwargs and len(args) == len(parameter_names):
+            arguments = dict(zip(parameter_names, args, strict=True))
+        else:
+            bound_arguments = signature.bind(*args, **kwargs)
+            bound_arguments.apply_defaults()
+            arguments = bound_arguments.arguments
+        try:
+            rendered = "".join(
+                [
+                    segment if segment.__class__ is str else segment.render(arguments)
+                    for segment in state["segments"]
+                ]
+            )
+        except _DataDependentStructure:
+            return function(*args, **kwargs)
+
+        if not state["verified"]:
+            element = function(*args, **kwargs)
+            if "".join(element.render()) != rendered:
+                state["fallback"] = True
+                return element
+            state["verified"] = True
+
+        return state["frozen_class"](rendered)
+
+    # Lets `scripts/compile_components.py` find the components to compile.
+    render_component.__compiled_component__ = True
+    return render_component
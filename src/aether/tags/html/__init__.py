@@ -1,5 +1,8 @@
 # https://developer.mozilla.org/en-US/docs/Web/HTML
 
+from aether.base import attribute_key_normalizer
+from aether.plugins.htmx import HTMXAttributes
+
 from ._base import BaseHTMLElement, GlobalHTMLAttributes
 from .a import A, AAttributes
 from .abbr import Abbr, AbbrAttributes
@@ -329,3 +332,8 @@ __all__ = [
     "Wbr",
     "WbrAttributes",
 ]
+
+attribute_key_normalizer.seed(
+    HTMXAttributes,
+    *(globals()[name] for name in __all__ if name.endswith("Attributes")),
+)
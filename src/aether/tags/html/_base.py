@@ -19,6 +19,8 @@ class HTMLContentCategories(StrEnum):
 
 
 class BaseHTMLElement(BaseWebElement[HTMLContentCategories]):
+    __slots__ = ()
+
     web_element_type = WebElementType.HTML
 
 
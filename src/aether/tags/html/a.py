@@ -52,6 +52,8 @@ class AAttributes(GlobalHTMLAttributes):
 
 
 class A(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "a"
     have_children = True
     content_category = (
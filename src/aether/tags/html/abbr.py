@@ -29,6 +29,8 @@ class AbbrAttributes(GlobalHTMLAttributes):
 
 
 class Abbr(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "abbr"
     have_children = True
     content_category = (
@@ -29,6 +29,8 @@ class AddressAttributes(GlobalHTMLAttributes):
 
 
 class Address(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "address"
     have_children = True
     content_category = (
@@ -79,6 +79,8 @@ def _validate_href_alt_conditional(data: AreaAttributes) -> None:
 
 
 class Area(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "area"
     have_children = False
     content_category = (
@@ -29,6 +29,8 @@ class ArticleAttributes(GlobalHTMLAttributes):
 
 
 class Article(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "article"
     have_children = True
     content_category = (
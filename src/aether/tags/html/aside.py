@@ -29,6 +29,8 @@ class AsideAttributes(GlobalHTMLAttributes):
 
 
 class Aside(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "aside"
     have_children = True
     content_category = (
@@ -1,9 +1,9 @@
 import warnings
-from collections.abc import Generator, Iterable
 from typing import Literal, NotRequired, Self
 
 from pydantic import ValidationError as PydanticValidationError
 
+from aether.base import ChildModel
 from aether.errors import ValidationError
 from aether.utils import (
     ValidatorFunction,
@@ -51,6 +51,8 @@ class AudioAttributes(GlobalHTMLAttributes):
 
 
 class Audio(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "audio"
     have_children = True
     content_category = (
@@ -58,6 +60,9 @@ class Audio(BaseHTMLElement):
         HTMLContentCategories.PHRASING,
         HTMLContentCategories.EMBEDDED,
     )
+    child_model = ChildModel(
+        allowed_types=(A, P, Source, Track), counted_types=(Source,)
+    )
 
     def __init__(self, **attributes: Unpack[AudioAttributes]):
         try:
@@ -75,9 +80,9 @@ class Audio(BaseHTMLElement):
 
         super().__init__(**validated_attributes)
 
-    def __call__(self, *children: tuple) -> Self:
+    def _check_children(self, child_counts: dict[type, int]) -> None:
         has_src_attribute = self.attributes.get("src") is not None
-        has_any_source_child_tag = any(isinstance(child, Source) for child in children)
+        has_any_source_child_tag = child_counts[Source] > 0
 
         if not has_src_attribute and not has_any_source_child_tag:
             raise ValueError(
@@ -87,41 +92,6 @@ class Audio(BaseHTMLElement):
             warnings.warn(
                 "Both `src` attribute and `Source` child tag are provided. Ignoring `src` attribute.",
                 UserWarning,
-                stacklevel=2,
+                stacklevel=4,
             )
             self.attributes.pop("src")
-
-        allowed_child_types = (str, A, P, Source, Track)
-        if self.have_children:
-            for child in children:
-                if isinstance(child, allowed_child_types) or not isinstance(
-                    child, Iterable
-                ):
-                    self.children.append(child)
-                elif isinstance(child, Generator):
-                    serialized_children_generator = list(child)
-                    if all(
-                        isinstance(node, allowed_child_types)
-                        for node in serialized_children_generator
-                    ):
-                        self.children.extend(serialized_children_generator)
-                    else:
-                        raise ValueError(
-                            f"Invalid child type found. `{self.__class__.__qualname__}` can only have {', '.join([type(allowed_type).__class__.__qualname__ for allowed_type in allowed_child_types])}."
-                        )
-                elif isinstance(child, type(None)):
-                    continue
-                else:
-                    if all(isinstance(node, allowed_child_types) for node in child):
-                        self.children.extend(child)
-                    else:
-                        raise ValueError(
-                            f"Invalid child type found. `{self.__class__.__qualname__}` can only have {', '.join([type(allowed_type).__class__.__qualname__ for allowed_type in allowed_child_types])}."
-                        )
-        else:
-            warnings.warn(
-                f"Trying to add child to a non-child element: {self.__class__.__qualname__}",
-                UserWarning,
-                stacklevel=2,
-            )
-        return self
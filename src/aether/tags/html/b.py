@@ -29,6 +29,8 @@ class BAttributes(GlobalHTMLAttributes):
 
 
 class B(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "b"
     have_children = True
     content_category = (
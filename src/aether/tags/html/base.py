@@ -36,6 +36,8 @@ class BaseAttributes(GlobalHTMLAttributes):
 
 
 class Base(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "base"
     have_children = False
     content_category = (HTMLContentCategories.METADATA,)
@@ -35,6 +35,8 @@ class BdiAttributes(GlobalHTMLAttributes):
 
 
 class Bdi(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "bdi"
     have_children = True
     content_category = (
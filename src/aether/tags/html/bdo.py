@@ -31,6 +31,8 @@ class BdoAttributes(GlobalHTMLAttributes):
 
 
 class Bdo(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "bdo"
     have_children = True
     content_category = (
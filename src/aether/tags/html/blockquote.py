@@ -31,6 +31,8 @@ class BlockquoteAttributes(GlobalHTMLAttributes):
 
 
 class Blockquote(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "blockquote"
     have_children = True
     content_category = (
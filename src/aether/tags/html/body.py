@@ -32,6 +32,8 @@ class BodyAttributes(GlobalHTMLAttributes):
 
 
 class Body(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "body"
     have_children = True
     content_category = None
@@ -29,6 +29,8 @@ class BrAttributes(GlobalHTMLAttributes):
 
 
 class Br(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "br"
     have_children = False
     content_category = (HTMLContentCategories.FLOW, HTMLContentCategories.PHRASING)
@@ -99,6 +99,8 @@ def _validate_form_conditional(data: ButtonAttributes) -> None:
 
 
 class Button(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "button"
     have_children = True
     content_category = (
@@ -36,6 +36,8 @@ class CanvasAttributes(GlobalHTMLAttributes):
 
 
 class Canvas(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "canvas"
     have_children = True
     content_category = (
@@ -29,6 +29,8 @@ class CaptionAttributes(GlobalHTMLAttributes):
 
 
 class Caption(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "caption"
     have_children = True
     content_category = None
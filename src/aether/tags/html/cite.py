@@ -29,6 +29,8 @@ class CiteAttributes(GlobalHTMLAttributes):
 
 
 class Cite(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "cite"
     have_children = True
     content_category = (
@@ -29,6 +29,8 @@ class CodeAttributes(GlobalHTMLAttributes):
 
 
 class Code(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "code"
     have_children = True
     content_category = (
@@ -35,6 +35,8 @@ class ColAttributes(GlobalHTMLAttributes):
 
 
 class Col(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "col"
     have_children = False
     content_category = None
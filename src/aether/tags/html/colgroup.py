@@ -1,9 +1,9 @@
 import warnings
-from collections.abc import Generator, Iterable
 from typing import NotRequired, Self
 
 from pydantic import ValidationError as PydanticValidationError
 
+from aether.base import ChildModel
 from aether.errors import ValidationError
 from aether.utils import (
     ValidatorFunction,
@@ -34,9 +34,12 @@ class ColgroupAttributes(GlobalHTMLAttributes):
 
 
 class Colgroup(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "colgroup"
     have_children = True
     content_category = None
+    child_model = ChildModel(allowed_types=(Col,), counted_types=(Col,))
 
     def __init__(self, **attributes: Unpack[ColgroupAttributes]):
         try:
@@ -46,51 +49,14 @@ class Colgroup(BaseHTMLElement):
 
         super().__init__(**validated_attributes)
 
-    def __call__(self, *children: tuple) -> Self:
+    def _check_children(self, child_counts: dict[type, int]) -> None:
         has_span_attribute = self.attributes.get("span") is not None
-        has_any_col_child_tag = any(isinstance(child, Col) for child in children)
-        allowed_child_types = (str, Col)
+        has_any_col_child_tag = child_counts[Col] > 0
 
-        if self.have_children:
-            if has_span_attribute and has_any_col_child_tag:
-                warnings.warn(
-                    "`span` attribute is not permitted if there are one or more `col` child tags are provided. Ignoring `span` attribute.",
-                    UserWarning,
-                    stacklevel=2,
-                )
-                self.attributes.pop("span")
-            for child in children:
-                if isinstance(child, allowed_child_types) or not isinstance(
-                    child, Iterable
-                ):
-                    self.children.append(child)
-                elif isinstance(child, Generator):
-                    serialized_children_generator = list(child)
-                    if all(
-                        isinstance(gen_child, allowed_child_types)
-                        for gen_child in serialized_children_generator
-                    ):
-                        self.children.extend(serialized_children_generator)
-                    else:
-                        raise ValueError(
-                            f"Invalid child type found. `{self.__class__.__qualname__}` can only have {', '.join([type(allowed_type).__class__.__qualname__ for allowed_type in allowed_child_types])}."
-                        )
-                elif isinstance(child, type(None)):
-                    continue
-                else:
-                    if all(
-                        isinstance(iter_child, allowed_child_types)
-                        for iter_child in child
-                    ):
-                        self.children.extend(child)
-                    else:
-                        raise ValueError(
-                            f"Invalid child type found. `{self.__class__.__qualname__}` can only have {', '.join([type(allowed_type).__class__.__qualname__ for allowed_type in allowed_child_types])}."
-                        )
-        else:
+        if has_span_attribute and has_any_col_child_tag:
             warnings.warn(
-                f"Trying to add child to a non-child element: {self.__class__.__qualname__}",
+                "`span` attribute is not permitted if there are one or more `col` child tags are provided. Ignoring `span` attribute.",
                 UserWarning,
-                stacklevel=2,
+                stacklevel=4,
             )
-        return self
+            self.attributes.pop("span")
@@ -31,6 +31,8 @@ class DataAttributes(GlobalHTMLAttributes):
 
 
 class Data(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "data"
     have_children = True
     content_category = (
@@ -1,9 +1,8 @@
-import warnings
-from collections.abc import Generator, Iterable
 from typing import Self
 
 from pydantic import ValidationError as PydanticValidationError
 
+from aether.base import ChildModel
 from aether.errors import ValidationError
 from aether.utils import (
     ValidatorFunction,
@@ -34,12 +33,15 @@ class DatalistAttributes(GlobalHTMLAttributes):
 
 
 class Datalist(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "datalist"
     have_children = True
     content_category = (
         HTMLContentCategories.FLOW,
         HTMLContentCategories.PHRASING,
     )
+    child_model = ChildModel(allowed_types=(Option,))
 
     def __init__(self, **attributes: Unpack[DatalistAttributes]):
         try:
@@ -48,43 +50,3 @@ class Datalist(BaseHTMLElement):
             raise ValueError(format_validation_error_message(err))
 
         super().__init__(**validated_attributes)
-
-    def __call__(self, *children: tuple) -> Self:
-        allowed_child_types = (str, Option)
-
-        if self.have_children:
-            for child in children:
-                if isinstance(child, allowed_child_types) or not isinstance(
-                    child, Iterable
-                ):
-                    self.children.append(child)
-                elif isinstance(child, Generator):
-                    serialized_children_generator = list(child)
-                    if all(
-                        isinstance(gen_child, allowed_child_types)
-                        for gen_child in serialized_children_generator
-                    ):
-                        self.children.extend(serialized_children_generator)
-                    else:
-                        raise ValueError(
-                            f"Invalid child type found. `{self.__class__.__qualname__}` can only have {', '.join([type(allowed_type).__class__.__qualname__ for allowed_type in allowed_child_types])}."
-                        )
-                elif isinstance(child, type(None)):
-                    continue
-                else:
-                    if all(
-                        isinstance(iter_child, allowed_child_types)
-                        for iter_child in child
-                    ):
-                        self.children.extend(child)
-                    else:
-                        raise ValueError(
-                            f"Invalid child type found. `{self.__class__.__qualname__}` can only have {', '.join([type(allowed_type).__class__.__qualname__ for allowed_type in allowed_child_types])}."
-                        )
-        else:
-            warnings.warn(
-                f"Trying to add child to a non-child element: {self.__class__.__qualname__}",
-                UserWarning,
-                stacklevel=2,
-            )
-        return self
@@ -29,6 +29,8 @@ class DdAttributes(GlobalHTMLAttributes):
 
 
 class Dd(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "dd"
     have_children = True
     content_category = None
@@ -29,6 +29,8 @@ class DelAttributes(GlobalHTMLAttributes):
 
 
 class Del(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "del"
     have_children = True
     content_category = (
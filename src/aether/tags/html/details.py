@@ -2,6 +2,7 @@ from typing import Self
 
 from pydantic import ValidationError as PydanticValidationError
 
+from aether.base import ChildModel
 from aether.errors import ValidationError
 from aether.utils import (
     ValidatorFunction,
@@ -30,6 +31,8 @@ class DetailsAttributes(GlobalHTMLAttributes):
 
 
 class Details(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "details"
     have_children = True
     content_category = (
@@ -38,6 +41,7 @@ class Details(BaseHTMLElement):
         HTMLContentCategories.INTERACTIVE,
         HTMLContentCategories.PALPABLE,
     )
+    child_model = ChildModel(cardinality={Summary: (1, 1)})
 
     def __init__(self, **attributes: Unpack[DetailsAttributes]):
         try:
@@ -46,19 +50,3 @@ class Details(BaseHTMLElement):
             raise ValueError(format_validation_error_message(err))
 
         super().__init__(**validated_attributes)
-
-    def __call__(self, *children: tuple) -> Self:
-        count_summary_child_tags = [
-            isinstance(child, Summary) for child in children
-        ].count(True)
-
-        if count_summary_child_tags > 1:
-            raise ValueError(
-                f"Only one `summary` child is allowed in a `{self.__class__.__qualname__}` element. Found {count_summary_child_tags}."
-            )
-        elif count_summary_child_tags <= 0:
-            raise ValueError(
-                f"At least one `summary` child is required in a `{self.__class__.__qualname__}` element."
-            )
-        else:
-            return super().__call__(*children)
@@ -29,6 +29,8 @@ class DfnAttributes(GlobalHTMLAttributes):
 
 
 class Dfn(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "dfn"
     have_children = True
     content_category = (
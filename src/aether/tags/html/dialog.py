@@ -31,6 +31,8 @@ class DialogAttributes(GlobalHTMLAttributes):
 
 
 class Dialog(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "dialog"
     have_children = True
     content_category = (
@@ -29,6 +29,8 @@ class DivAttributes(GlobalHTMLAttributes):
 
 
 class Div(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "div"
     have_children = True
     content_category = (
@@ -29,6 +29,8 @@ class DtAttributes(GlobalHTMLAttributes):
 
 
 class Dt(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "dt"
     have_children = True
     content_category = None
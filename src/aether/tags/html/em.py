@@ -29,6 +29,8 @@ class EmAttributes(GlobalHTMLAttributes):
 
 
 class Em(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "em"
     have_children = True
     content_category = (
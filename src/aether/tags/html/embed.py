@@ -34,6 +34,8 @@ class EmbedAttributes(GlobalHTMLAttributes):
 
 
 class Embed(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "embed"
     have_children = False
     content_category = (
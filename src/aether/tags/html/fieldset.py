@@ -33,6 +33,8 @@ class FieldsetAttributes(GlobalHTMLAttributes):
 
 
 class Fieldset(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "fieldset"
     have_children = True
     content_category = (
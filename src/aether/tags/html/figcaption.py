@@ -29,6 +29,8 @@ class FigcaptionAttributes(GlobalHTMLAttributes):
 
 
 class Figcaption(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "figcaption"
     have_children = True
     content_category = None
@@ -29,6 +29,8 @@ class FigureAttributes(GlobalHTMLAttributes):
 
 
 class Figure(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "figure"
     have_children = True
     content_category = (
@@ -29,6 +29,8 @@ class FooterAttributes(GlobalHTMLAttributes):
 
 
 class Footer(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "footer"
     have_children = True
     content_category = (
@@ -53,6 +53,8 @@ class FormAttributes(GlobalHTMLAttributes):
 
 
 class Form(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "form"
     have_children = True
     content_category = (
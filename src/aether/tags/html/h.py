@@ -30,6 +30,8 @@ class HAttributes(GlobalHTMLAttributes):
 
 ### H1 ###
 class H1(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "h1"
     have_children = True
     content_category = (
@@ -49,6 +51,8 @@ class H1(BaseHTMLElement):
 
 ### H2 ###
 class H2(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "h2"
     have_children = True
     content_category = (
@@ -68,6 +72,8 @@ class H2(BaseHTMLElement):
 
 ### H3 ###
 class H3(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "h3"
     have_children = True
     content_category = (
@@ -87,6 +93,8 @@ class H3(BaseHTMLElement):
 
 ### H4 ###
 class H4(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "h4"
     have_children = True
     content_category = (
@@ -106,6 +114,8 @@ class H4(BaseHTMLElement):
 
 ### H5 ###
 class H5(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "h5"
     have_children = True
     content_category = (
@@ -125,6 +135,8 @@ class H5(BaseHTMLElement):
 
 ### H6 ###
 class H6(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "h6"
     have_children = True
     content_category = (
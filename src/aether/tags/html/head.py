@@ -29,6 +29,8 @@ class HeadAttributes(GlobalHTMLAttributes):
 
 
 class Head(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "head"
     have_children = True
     content_category = None
@@ -29,6 +29,8 @@ class HeaderAttributes(GlobalHTMLAttributes):
 
 
 class Header(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "header"
     have_children = True
     content_category = (
@@ -1,9 +1,8 @@
-import warnings
-from collections.abc import Generator, Iterable
 from typing import NotRequired, Self
 
 from pydantic import ValidationError as PydanticValidationError
 
+from aether.base import ChildModel
 from aether.errors import ValidationError
 from aether.utils import (
     ValidatorFunction,
@@ -35,6 +34,8 @@ class HgroupAttributes(GlobalHTMLAttributes):
 
 
 class Hgroup(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "hgroup"
     have_children = True
     content_category = (
@@ -42,6 +43,7 @@ class Hgroup(BaseHTMLElement):
         HTMLContentCategories.HEADING,
         HTMLContentCategories.PALPABLE,
     )
+    child_model = ChildModel(allowed_types=(P, H1, H2, H3, H4, H5, H6))
 
     def __init__(self, **attributes: Unpack[HgroupAttributes]):
         try:
@@ -50,43 +52,3 @@ class Hgroup(BaseHTMLElement):
             raise ValueError(format_validation_error_message(err))
 
         super().__init__(**validated_attributes)
-
-    def __call__(self, *children: tuple) -> Self:
-        allowed_child_types = (str, P, H1, H2, H3, H4, H5, H6)
-
-        if self.have_children:
-            for child in children:
-                if isinstance(child, allowed_child_types) or not isinstance(
-                    child, Iterable
-                ):
-                    self.children.append(child)
-                elif isinstance(child, Generator):
-                    serialized_children_generator = list(child)
-                    if all(
-                        isinstance(gen_child, allowed_child_types)
-                        for gen_child in serialized_children_generator
-                    ):
-                        self.children.extend(serialized_children_generator)
-                    else:
-                        raise ValueError(
-                            f"Invalid child type found. `{self.__class__.__qualname__}` can only have {', '.join([type(allowed_type).__class__.__qualname__ for allowed_type in allowed_child_types])}."
-                        )
-                elif isinstance(child, type(None)):
-                    continue
-                else:
-                    if all(
-                        isinstance(iter_child, allowed_child_types)
-                        for iter_child in child
-                    ):
-                        self.children.extend(child)
-                    else:
-                        raise ValueError(
-                            f"Invalid child type found. `{self.__class__.__qualname__}` can only have {', '.join([type(allowed_type).__class__.__qualname__ for allowed_type in allowed_child_types])}."
-                        )
-        else:
-            warnings.warn(
-                f"Trying to add child to a non-child element: {self.__class__.__qualname__}",
-                UserWarning,
-                stacklevel=2,
-            )
-        return self
@@ -29,6 +29,8 @@ class HrAttributes(GlobalHTMLAttributes):
 
 
 class Hr(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "hr"
     have_children = False
     content_category = (HTMLContentCategories.FLOW,)
@@ -1,4 +1,3 @@
-from collections.abc import Generator
 from typing import NotRequired, Self
 
 from pydantic import ValidationError as PydanticValidationError
@@ -37,6 +36,8 @@ class HtmlAttributes(GlobalHTMLAttributes):
 
 
 class Html(BaseHTMLElement):
+    __slots__ = ("doctype_value",)
+
     tag_name = "html"
     have_children = True
     content_category = None
@@ -54,7 +55,8 @@ class Html(BaseHTMLElement):
         super().__init__(**validated_attributes)
         self.doctype_value = doctype_value
 
-    def render(self, stringify: bool = True) -> Generator[str, None, None]:
+    def _render_start_tag(self) -> str:
+        start_tag = super()._render_start_tag()
         if self.doctype_value:
-            yield f"<!DOCTYPE {self.doctype_value}>"
-        yield from super().render(stringify)
+            return f"<!DOCTYPE {self.doctype_value}>{start_tag}"
+        return start_tag
@@ -29,6 +29,8 @@ class IAttributes(GlobalHTMLAttributes):
 
 
 class I(BaseHTMLElement):  # noqa: E742
+    __slots__ = ()
+
     tag_name = "i"
     have_children = True
     content_category = (
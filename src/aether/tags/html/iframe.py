@@ -29,6 +29,8 @@ class IframeAttributes(GlobalHTMLAttributes):
 
 
 class Iframe(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "iframe"
     have_children = True
     content_category = (
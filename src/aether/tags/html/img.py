@@ -57,6 +57,8 @@ class ImgAttributes(GlobalHTMLAttributes):
 
 
 class Img(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "img"
     have_children = False
     content_category = (
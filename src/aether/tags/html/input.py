@@ -63,6 +63,8 @@ class InputAttributes(GlobalHTMLAttributes):
 
 
 class Input(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "input"
     have_children = False
     content_category = (
@@ -32,6 +32,8 @@ class InsAttributes(GlobalHTMLAttributes):
 
 
 class Ins(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "ins"
     have_children = True
     content_category = (
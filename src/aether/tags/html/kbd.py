@@ -29,6 +29,8 @@ class KbdAttributes(GlobalHTMLAttributes):
 
 
 class Kbd(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "kbd"
     have_children = True
     content_category = (
@@ -31,6 +31,8 @@ class LabelAttributes(GlobalHTMLAttributes):
 
 
 class Label(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "label"
     have_children = True
     content_category = (
@@ -29,6 +29,8 @@ class LegendAttributes(GlobalHTMLAttributes):
 
 
 class Legend(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "legend"
     have_children = True
     content_category = None
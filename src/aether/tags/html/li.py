@@ -31,6 +31,8 @@ class LiAttributes(GlobalHTMLAttributes):
 
 
 class Li(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "li"
     have_children = True
     content_category = None
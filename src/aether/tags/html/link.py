@@ -69,6 +69,8 @@ class LinkAttributes(GlobalHTMLAttributes):
 
 
 class Link(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "link"
     have_children = False
     content_category = (HTMLContentCategories.METADATA,)
@@ -29,6 +29,8 @@ class MainAttributes(GlobalHTMLAttributes):
 
 
 class Main(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "main"
     have_children = True
     content_category = (
@@ -29,6 +29,8 @@ class MarkAttributes(GlobalHTMLAttributes):
 
 
 class Mark(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "mark"
     have_children = True
     content_category = (
@@ -43,6 +43,8 @@ class MetaAttributes(GlobalHTMLAttributes):
 
 
 class Meta(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "meta"
     have_children = False
     content_category = (HTMLContentCategories.FLOW,)
@@ -41,6 +41,8 @@ class MeterAttributes(GlobalHTMLAttributes):
 
 
 class Meter(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "meter"
     have_children = True
     content_category = (
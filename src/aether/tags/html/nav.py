@@ -29,6 +29,8 @@ class NavAttributes(GlobalHTMLAttributes):
 
 
 class Nav(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "nav"
     have_children = True
     content_category = (
@@ -29,6 +29,8 @@ class NoscriptAttributes(GlobalHTMLAttributes):
 
 
 class Noscript(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "noscript"
     have_children = True
     content_category = (
@@ -36,6 +36,8 @@ class ObjectAttributes(GlobalHTMLAttributes):
 
 
 class Object(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "object"
     have_children = True
     content_category = (
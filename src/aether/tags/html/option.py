@@ -34,6 +34,8 @@ class OptionAttributes(GlobalHTMLAttributes):
 
 
 class Option(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "option"
     have_children = True
     content_category = None
@@ -33,6 +33,8 @@ class OutputAttributes(GlobalHTMLAttributes):
 
 
 class Output(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "output"
     have_children = True
     content_category = (
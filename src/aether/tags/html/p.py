@@ -33,6 +33,8 @@ class PAttributes(GlobalHTMLAttributes):
 
 
 class P(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "p"
     have_children = True
     content_category = (
@@ -1,9 +1,8 @@
-import warnings
-from collections.abc import Generator, Iterable
 from typing import NotRequired, Self
 
 from pydantic import ValidationError as PydanticValidationError
 
+from aether.base import ChildModel
 from aether.errors import ValidationError
 from aether.utils import (
     ValidatorFunction,
@@ -36,6 +35,8 @@ class PictureAttributes(GlobalHTMLAttributes):
 
 
 class Picture(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "picture"
     have_children = True
     content_category = (
@@ -43,6 +44,7 @@ class Picture(BaseHTMLElement):
         HTMLContentCategories.PHRASING,
         HTMLContentCategories.PALPABLE,
     )
+    child_model = ChildModel(allowed_types=(Img, Source), cardinality={Img: (1, 1)})
 
     def __init__(self, **attributes: Unpack[PictureAttributes]):
         try:
@@ -51,55 +53,3 @@ class Picture(BaseHTMLElement):
             raise ValueError(format_validation_error_message(err))
 
         super().__init__(**validated_attributes)
-
-    def __call__(self, *children: tuple) -> Self:
-        allowed_child_types = (str, Img, Source)
-        count_img_child_tags = [isinstance(child, Img) for child in children].count(
-            True
-        )
-
-        if count_img_child_tags > 1:
-            raise ValueError(
-                f"Only one `img` child is allowed in a `{self.__class__.__qualname__}` element. Found {count_img_child_tags}."
-            )
-        elif count_img_child_tags <= 0:
-            raise ValueError(
-                f"At least one `img` child is required in a `{self.__class__.__qualname__}` element."
-            )
-        else:
-            if self.have_children:
-                for child in children:
-                    if isinstance(child, allowed_child_types) or not isinstance(
-                        child, Iterable
-                    ):
-                        self.children.append(child)
-                    elif isinstance(child, Generator):
-                        serialized_children_generator = list(child)
-                        if all(
-                            isinstance(gen_child, allowed_child_types)
-                            for gen_child in serialized_children_generator
-                        ):
-                            self.children.extend(serialized_children_generator)
-                        else:
-                            raise ValueError(
-                                f"Invalid child type found. `{self.__class__.__qualname__}` can only have {', '.join([type(allowed_type).__class__.__qualname__ for allowed_type in allowed_child_types])}."
-                            )
-                    elif isinstance(child, type(None)):
-                        continue
-                    else:
-                        if all(
-                            isinstance(iter_child, allowed_child_types)
-                            for iter_child in child
-                        ):
-                            self.children.extend(child)
-                        else:
-                            raise ValueError(
-                                f"Invalid child type found. `{self.__class__.__qualname__}` can only have {', '.join([type(allowed_type).__class__.__qualname__ for allowed_type in allowed_child_types])}."
-                            )
-            else:
-                warnings.warn(
-                    f"Trying to add child to a non-child element: {self.__class__.__qualname__}",
-                    UserWarning,
-                    stacklevel=2,
-                )
-        return self
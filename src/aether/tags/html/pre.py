@@ -29,6 +29,8 @@ class PreAttributes(GlobalHTMLAttributes):
 
 
 class Pre(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "pre"
     have_children = True
     content_category = (HTMLContentCategories.FLOW, HTMLContentCategories.PALPABLE)
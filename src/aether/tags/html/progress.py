@@ -36,6 +36,8 @@ class ProgressAttributes(GlobalHTMLAttributes):
 
 
 class Progress(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "progress"
     have_children = True
     content_category = (
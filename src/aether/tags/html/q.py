@@ -31,6 +31,8 @@ class QAttributes(GlobalHTMLAttributes):
 
 
 class Q(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "q"
     have_children = True
     content_category = (
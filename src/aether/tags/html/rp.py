@@ -29,6 +29,8 @@ class RpAttributes(GlobalHTMLAttributes):
 
 
 class Rp(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "rp"
     have_children = True
     content_category = None
@@ -29,6 +29,8 @@ class RtAttributes(GlobalHTMLAttributes):
 
 
 class Rt(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "rt"
     have_children = True
     content_category = None
@@ -29,6 +29,8 @@ class RubyAttributes(GlobalHTMLAttributes):
 
 
 class Ruby(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "ruby"
     have_children = True
     content_category = (
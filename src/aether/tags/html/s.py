@@ -29,6 +29,8 @@ class SAttributes(GlobalHTMLAttributes):
 
 
 class S(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "s"
     have_children = True
     content_category = (HTMLContentCategories.FLOW, HTMLContentCategories.PHRASING)
@@ -29,6 +29,8 @@ class SampAttributes(GlobalHTMLAttributes):
 
 
 class Samp(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "samp"
     have_children = True
     content_category = (
@@ -52,6 +52,8 @@ class ScriptAttributes(GlobalHTMLAttributes):
 
 
 class Script(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "script"
     have_children = True
     content_category = (
@@ -29,6 +29,8 @@ class SearchAttributes(GlobalHTMLAttributes):
 
 
 class Search(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "search"
     have_children = True
     content_category = (HTMLContentCategories.FLOW, HTMLContentCategories.PALPABLE)
@@ -29,6 +29,8 @@ class SectionAttributes(GlobalHTMLAttributes):
 
 
 class Section(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "section"
     have_children = True
     content_category = (
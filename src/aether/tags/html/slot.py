@@ -31,6 +31,8 @@ class SlotAttributes(GlobalHTMLAttributes):
 
 
 class Slot(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "slot"
     have_children = True
     content_category = (HTMLContentCategories.FLOW, HTMLContentCategories.PHRASING)
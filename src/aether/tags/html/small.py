@@ -29,6 +29,8 @@ class SmallAttributes(GlobalHTMLAttributes):
 
 
 class Small(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "small"
     have_children = True
     content_category = (HTMLContentCategories.FLOW, HTMLContentCategories.PHRASING)
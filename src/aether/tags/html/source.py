@@ -37,6 +37,8 @@ class SourceAttributes(GlobalHTMLAttributes):
 
 
 class Source(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "source"
     have_children = False
     content_category = None
@@ -29,6 +29,8 @@ class SpanAttributes(GlobalHTMLAttributes):
 
 
 class Span(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "span"
     have_children = True
     content_category = (HTMLContentCategories.FLOW, HTMLContentCategories.PHRASING)
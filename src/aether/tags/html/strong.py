@@ -29,6 +29,8 @@ class StrongAttributes(GlobalHTMLAttributes):
 
 
 class Strong(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "strong"
     have_children = True
     content_category = (
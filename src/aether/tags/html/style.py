@@ -34,6 +34,8 @@ class StyleAttributes(GlobalHTMLAttributes):
 
 
 class Style(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "style"
     have_children = True
     content_category = (HTMLContentCategories.METADATA,)
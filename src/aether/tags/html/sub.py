@@ -29,6 +29,8 @@ class SubAttributes(GlobalHTMLAttributes):
 
 
 class Sub(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "sub"
     have_children = True
     content_category = (
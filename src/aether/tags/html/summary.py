@@ -29,6 +29,8 @@ class SummaryAttributes(GlobalHTMLAttributes):
 
 
 class Summary(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "summary"
     have_children = True
     content_category = None
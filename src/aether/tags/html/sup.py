@@ -29,6 +29,8 @@ class SupAttributes(GlobalHTMLAttributes):
 
 
 class Sup(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "sup"
     have_children = True
     content_category = (
@@ -37,6 +37,8 @@ class TdAttributes(GlobalHTMLAttributes):
 
 
 class Td(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "td"
     have_children = True
     content_category = (HTMLContentCategories.SECTIONING,)
@@ -33,6 +33,8 @@ class TemplateAttributes(GlobalHTMLAttributes):
 
 
 class Template(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "template"
     have_children = True
     content_category = (
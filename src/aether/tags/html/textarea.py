@@ -45,6 +45,8 @@ class TextareaAttributes(GlobalHTMLAttributes):
 
 
 class Textarea(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "textarea"
     have_children = True
     content_category = (
@@ -29,6 +29,8 @@ class TfootAttributes(GlobalHTMLAttributes):
 
 
 class Tfoot(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "tfoot"
     have_children = True
     content_category = None
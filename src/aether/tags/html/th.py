@@ -39,6 +39,8 @@ class ThAttributes(GlobalHTMLAttributes):
 
 
 class Th(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "th"
     have_children = True
     content_category = None
@@ -29,6 +29,8 @@ class TheadAttributes(GlobalHTMLAttributes):
 
 
 class Thead(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "thead"
     have_children = True
     content_category = None
@@ -31,6 +31,8 @@ class TimeAttributes(GlobalHTMLAttributes):
 
 
 class Time(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "time"
     have_children = True
     content_category = (
@@ -29,6 +29,8 @@ class TitleAttributes(GlobalHTMLAttributes):
 
 
 class Title(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "title"
     have_children = True
     content_category = (HTMLContentCategories.METADATA,)
@@ -29,6 +29,8 @@ class TrAttributes(GlobalHTMLAttributes):
 
 
 class Tr(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "tr"
     have_children = True
     content_category = None
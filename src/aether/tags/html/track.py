@@ -35,6 +35,8 @@ class TrackAttributes(GlobalHTMLAttributes):
 
 
 class Track(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "track"
     have_children = False
     content_category = None
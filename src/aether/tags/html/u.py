@@ -29,6 +29,8 @@ class UAttributes(GlobalHTMLAttributes):
 
 
 class U(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "u"
     have_children = True
     content_category = (
@@ -29,6 +29,8 @@ class VarAttributes(GlobalHTMLAttributes):
 
 
 class Var(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "var"
     have_children = True
     content_category = (
@@ -1,9 +1,9 @@
 import warnings
-from collections.abc import Generator, Iterable
 from typing import Literal, NotRequired, Self
 
 from pydantic import ValidationError as PydanticValidationError
 
+from aether.base import ChildModel
 from aether.errors import ValidationError
 from aether.utils import (
     ValidatorFunction,
@@ -56,6 +56,8 @@ class VideoAttributes(GlobalHTMLAttributes):
 
 
 class Video(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "video"
     have_children = True
     content_category = (
@@ -63,6 +65,9 @@ class Video(BaseHTMLElement):
         HTMLContentCategories.PHRASING,
         HTMLContentCategories.EMBEDDED,
     )
+    child_model = ChildModel(
+        allowed_types=(A, P, Source, Track), counted_types=(Source,)
+    )
 
     def __init__(self, **attributes: Unpack[VideoAttributes]):
         try:
@@ -80,52 +85,18 @@ class Video(BaseHTMLElement):
 
         super().__init__(**validated_attributes)
 
-    def __call__(self, *children: tuple) -> Self:
+    def _check_children(self, child_counts: dict[type, int]) -> None:
         has_src_attribute = self.attributes.get("src") is not None
-        has_any_source_child_tag = any(isinstance(child, Source) for child in children)
-        allowed_child_types = (str, A, P, Source, Track)
-        if self.have_children:
-            if not has_src_attribute and not has_any_source_child_tag:
-                raise ValueError(
-                    f"Either `src` attribute or `Source` child tag must be provided for `{self.__class__.__qualname__}`."
-                )
-            if has_src_attribute and has_any_source_child_tag:
-                warnings.warn(
-                    "Both `src` attribute and `Source` child tag are provided. Ignoring `src` attribute.",
-                    UserWarning,
-                    stacklevel=2,
-                )
-                self.attributes.pop("src")
-
-            for child in children:
-                if isinstance(child, allowed_child_types) or not isinstance(
-                    child, Iterable
-                ):
-                    self.children.append(child)
-                elif isinstance(child, Generator):
-                    serialized_children_generator = list(child)
-                    if all(
-                        isinstance(node, allowed_child_types)
-                        for node in serialized_children_generator
-                    ):
-                        self.children.extend(serialized_children_generator)
-                    else:
-                        raise ValueError(
-                            f"Invalid child type found. `{self.__class__.__qualname__}` can only have {', '.join([type(allowed_type).__class__.__qualname__ for allowed_type in allowed_child_types])}."
-                        )
-                elif isinstance(child, type(None)):
-                    continue
-                else:
-                    if all(isinstance(node, allowed_child_types) for node in child):
-                        self.children.extend(child)
-                    else:
-                        raise ValueError(
-                            f"Invalid child type found. `{self.__class__.__qualname__}` can only have {', '.join([type(allowed_type).__class__.__qualname__ for allowed_type in allowed_child_types])}."
-                        )
-        else:
+        has_any_source_child_tag = child_counts[Source] > 0
+
+        if not has_src_attribute and not has_any_source_child_tag:
+            raise ValueError(
+                f"Either `src` attribute or `Source` child tag must be provided for `{self.__class__.__qualname__}`."
+            )
+        if has_src_attribute and has_any_source_child_tag:
             warnings.warn(
-                f"Trying to add child to a non-child element: {self.__class__.__qualname__}",
+                "Both `src` attribute and `Source` child tag are provided. Ignoring `src` attribute.",
                 UserWarning,
-                stacklevel=2,
+                stacklevel=4,
             )
-        return self
+            self.attributes.pop("src")
@@ -29,6 +29,8 @@ class WbrAttributes(GlobalHTMLAttributes):
 
 
 class Wbr(BaseHTMLElement):
+    __slots__ = ()
+
     tag_name = "wbr"
     have_children = False
     content_category = (
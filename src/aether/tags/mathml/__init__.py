@@ -1,6 +1,12 @@
 # https://developer.mozilla.org/en-US/docs/Web/MathML
 
+from aether.base import attribute_key_normalizer
+
 from ._base import BaseMathMLElement, GlobalMathMLAttributes
 from .math import Math, MathAttributes
 
 __all__ = ["BaseMathMLElement", "GlobalMathMLAttributes", "Math", "MathAttributes"]
+
+attribute_key_normalizer.seed(
+    *(globals()[name] for name in __all__ if name.endswith("Attributes"))
+)
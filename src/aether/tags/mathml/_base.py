@@ -14,6 +14,8 @@ class MathMLContentCategories(StrEnum):
 
 
 class BaseMathMLElement(BaseWebElement[MathMLContentCategories]):
+    __slots__ = ()
+
     web_element_type = WebElementType.MATHML
 
 
@@ -35,6 +35,8 @@ class MathAttributes(GlobalMathMLAttributes):
 
 
 class Math(BaseMathMLElement):
+    __slots__ = ()
+
     tag_name = "math"
     have_children = True
     content_category = (MathMLContentCategories.TOP_LEVEL,)
@@ -1,5 +1,7 @@
 # https://developer.mozilla.org/en-US/docs/Web/SVG
 
+from aether.base import attribute_key_normalizer
+
 from ._base import BaseSVGAttributes, BaseSVGElement
 from .circle import Circle, CircleAttributes
 from .defs import Defs, DefsAttributes
@@ -42,3 +44,7 @@ __all__ = [
     "TextAttributes",
     "BaseSVGAttributes",
 ]
+
+attribute_key_normalizer.seed(
+    *(globals()[name] for name in __all__ if name.endswith("Attributes"))
+)
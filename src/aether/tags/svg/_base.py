@@ -25,6 +25,8 @@ class SVGContentCategories(StrEnum):
 
 
 class BaseSVGElement(BaseWebElement[SVGContentCategories]):
+    __slots__ = ()
+
     web_element_type = WebElementType.SVG
 
 
@@ -38,6 +38,8 @@ class CircleAttributes(BaseSVGAttributes):
 
 
 class Circle(BaseSVGElement):
+    __slots__ = ()
+
     tag_name = "circle"
     have_children = False
     content_category = (
@@ -35,6 +35,8 @@ class DefsAttributes(BaseSVGAttributes):
 
 
 class Defs(BaseSVGElement):
+    __slots__ = ()
+
     tag_name = "defs"
     have_children = True
     content_category = (
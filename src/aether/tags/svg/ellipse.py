@@ -39,6 +39,8 @@ class EllipseAttributes(BaseSVGAttributes):
 
 
 class Ellipse(BaseSVGElement):
+    __slots__ = ()
+
     tag_name = "ellipse"
     have_children = False
     content_category = (
@@ -29,6 +29,8 @@ class GAttributes(BaseSVGAttributes):
 
 
 class G(BaseSVGElement):
+    __slots__ = ()
+
     tag_name = "g"
     have_children = True
     content_category = (SVGContentCategories.CONTAINER, SVGContentCategories.STRUCTURAL)
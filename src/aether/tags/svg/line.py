@@ -39,6 +39,8 @@ class LineAttributes(BaseSVGAttributes):
 
 
 class Line(BaseSVGElement):
+    __slots__ = ()
+
     tag_name = "line"
     have_children = False
     content_category = (
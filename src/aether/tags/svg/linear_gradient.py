@@ -51,6 +51,8 @@ class LinearGradientAttributes(BaseSVGAttributes):
 
 
 class LinearGradient(BaseSVGElement):
+    __slots__ = ()
+
     tag_name = "defs"
     have_children = True
     content_category = (SVGContentCategories.GRADIENT,)
@@ -36,6 +36,8 @@ class PathAttributes(BaseSVGAttributes):
 
 
 class Path(BaseSVGElement):
+    __slots__ = ()
+
     tag_name = "path"
     have_children = False
     content_category = (SVGContentCategories.GRAPHICS, SVGContentCategories.SHAPE)
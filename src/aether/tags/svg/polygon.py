@@ -36,6 +36,8 @@ class PolygonAttributes(BaseSVGAttributes):
 
 
 class Polygon(BaseSVGElement):
+    __slots__ = ()
+
     tag_name = "polygon"
     have_children = False
     content_category = (
@@ -49,6 +49,8 @@ class RectAttributes(BaseSVGAttributes):
 
 
 class Rect(BaseSVGElement):
+    __slots__ = ()
+
     tag_name = "rect"
     have_children = False
     content_category = (
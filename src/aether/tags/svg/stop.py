@@ -55,6 +55,8 @@ def _validate_stop_opacity_range(data: StopAttributes) -> None:
 
 
 class Stop(BaseSVGElement):
+    __slots__ = ()
+
     tag_name = "stop"
     have_children = False
     content_category = (SVGContentCategories.GRADIENT,)
@@ -49,6 +49,8 @@ class SvgAttributes(BaseSVGAttributes):
 
 
 class Svg(BaseSVGElement):
+    __slots__ = ()
+
     tag_name = "svg"
     have_children = True
     content_category = (SVGContentCategories.CONTAINER, SVGContentCategories.STRUCTURAL)
@@ -41,6 +41,8 @@ class TextAttributes(BaseSVGAttributes):
 
 
 class Text(BaseSVGElement):
+    __slots__ = ()
+
     tag_name = "text"
     have_children = True
     content_category = (
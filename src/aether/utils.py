@@ -1,17 +1,333 @@
-from collections.abc import Callable
-from typing import Any, TypedDict
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cache
+from itertools import count
+from types import NoneType, UnionType
+from typing import (
+    Annotated,
+    Any,
+    Literal,
+    NamedTuple,
+    NotRequired,
+    Required,
+    TypedDict,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 from pydantic import TypeAdapter
 from pydantic import ValidationError as PydanticValidationError
 
 from .errors import ValidationError
-from .safe_string import safestring_escape
+from .safe_string import SafeString, safestring_escape
 
 ValidatorFunction = Callable[
     [TypedDict], None
 ]  # TODO: Change the `None` to Error-as-value Type if and when I create it
 
 
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class TypeAdapterRegistry:
+    def __init__(self) -> None:
+        self._adapters: dict[type, TypeAdapter] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, cls: type) -> TypeAdapter:
+        with self._lock:
+            type_adapter = self._adapters.get(cls)
+            if type_adapter is not None:
+                self._hits += 1
+                return type_adapter
+
+            self._misses += 1
+            type_adapter = TypeAdapter(cls)
+            self._adapters[cls] = type_adapter
+            return type_adapter
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, None, len(self._adapters))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._adapters.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+type_adapter_registry = TypeAdapterRegistry()
+
+
+_trusted_mode_default = os.environ.get("AETHER_TRUSTED_MODE", "").lower() in {
+    "1",
+    "true",
+    "yes",
+}
+_trusted_mode: ContextVar[bool | None] = ContextVar("trusted_mode", default=None)
+
+
+def set_trusted_mode(enabled: bool) -> None:
+    global _trusted_mode_default
+    _trusted_mode_default = enabled
+
+
+def is_trusted_mode() -> bool:
+    enabled = _trusted_mode.get()
+    return _trusted_mode_default if enabled is None else enabled
+
+
+@contextmanager
+def trusted_mode(enabled: bool = True) -> Generator[None, None, None]:
+    token = _trusted_mode.set(enabled)
+    try:
+        yield
+    finally:
+        _trusted_mode.reset(token)
+
+
+_deferred_validation_default = False
+_deferred_validation: ContextVar[bool | None] = ContextVar(
+    "deferred_validation", default=None
+)
+
+
+def set_deferred_validation(enabled: bool) -> None:
+    global _deferred_validation_default
+    _deferred_validation_default = enabled
+
+
+def is_deferred_validation() -> bool:
+    enabled = _deferred_validation.get()
+    return _deferred_validation_default if enabled is None else enabled
+
+
+@contextmanager
+def deferred_validation(enabled: bool = True) -> Generator[None, None, None]:
+    token = _deferred_validation.set(enabled)
+    try:
+        yield
+    finally:
+        _deferred_validation.reset(token)
+
+
+class PendingValidation(NamedTuple):
+    cls: type
+    data: dict
+    custom_validators: list[ValidatorFunction] | None
+
+
+# Deferred validation records travel from `validate_dictionary_data`, called
+# by every tag's `__init__`, to `BaseWebElement.__init__` inside the returned
+# attributes, under a key that can not be an attribute name.
+PENDING_VALIDATION_KEY = "\x00pending_validation"
+
+
+def pop_pending_validation(attributes: dict) -> PendingValidation | None:
+    return attributes.pop(PENDING_VALIDATION_KEY, None)
+
+
+class ValidationCache:
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize = maxsize
+        self._validated_data: OrderedDict[tuple, dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: tuple) -> dict | None:
+        with self._lock:
+            validated_data = self._validated_data.get(key)
+            if validated_data is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._validated_data.move_to_end(key)
+        # Elements such as `Button` edit the validated data in place, hence
+        # every caller gets its own copy and the cached dict is never shared.
+        return dict(validated_data)
+
+    def set(self, key: tuple, validated_data: dict) -> None:
+        with self._lock:
+            self._validated_data[key] = dict(validated_data)
+            self._validated_data.move_to_end(key)
+            while len(self._validated_data) > self.maxsize:
+                self._validated_data.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._validated_data) > self.maxsize:
+                self._validated_data.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self.maxsize, len(self._validated_data)
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._validated_data.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+validation_cache = ValidationCache()
+
+
+def set_validation_cache_size(maxsize: int) -> None:
+    validation_cache.resize(maxsize)
+
+
+def _get_validation_cache_key(
+    cls, data: dict, custom_validators: list[ValidatorFunction] | None
+) -> tuple | None:
+    # The value type is part of the key as `1`, `1.0` and `True` compare equal
+    # but do not validate (or render) the same.
+    key = (
+        cls,
+        tuple((key, type(value), value) for key, value in data.items()),
+        tuple(custom_validators) if custom_validators else (),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class _FieldPositions(dict[str, int]):
+    def __init__(self, cls) -> None:
+        super().__init__(
+            (key, position) for position, key in enumerate(cls.__annotations__)
+        )
+        self.extra_position = len(self)
+
+    def __missing__(self, key: str) -> int:
+        return self.extra_position
+
+
+@cache
+def get_attribute_field_positions(cls) -> _FieldPositions:
+    return _FieldPositions(cls)
+
+
+def order_attribute_data(cls, data: dict) -> dict:
+    # Same key order as pydantic's output: declared fields first, then extras.
+    field_positions = get_attribute_field_positions(cls)
+    return {key: data[key] for key in sorted(data, key=field_positions.__getitem__)}
+
+
+_EXACT_TYPES = (str, bool, int, float, NoneType)
+_LITERAL_TYPES = (str, bool, int)
+
+
+def _collect_annotation_members(
+    annotation: Any, exact_types: set[type], literal_values: set[tuple[type, Any]]
+) -> bool:
+    origin = get_origin(annotation)
+    if origin is Required or origin is NotRequired:
+        return _collect_annotation_members(
+            get_args(annotation)[0], exact_types, literal_values
+        )
+    elif origin is Annotated:
+        # Constraints (`Field(ge=1)`, ...) are only checked by pydantic.
+        return False
+    elif origin is Literal:
+        literal_values.update((type(value), value) for value in get_args(annotation))
+        return all(isinstance(value, _LITERAL_TYPES) for value in get_args(annotation))
+    elif origin is Union or origin is UnionType:
+        return all(
+            _collect_annotation_members(member, exact_types, literal_values)
+            for member in get_args(annotation)
+        )
+    elif annotation in _EXACT_TYPES:
+        exact_types.add(annotation)
+        return True
+    else:
+        return False
+
+
+def _get_pydantic_config(cls) -> dict:
+    # TypedDict classes do not inherit class attributes, pydantic looks the
+    # config up through the original bases.
+    config = cls.__dict__.get("__pydantic_config__")
+    if config is not None:
+        return config
+    for base in getattr(cls, "__orig_bases__", ()):
+        config = _get_pydantic_config(base)
+        if config:
+            return config
+    return {}
+
+
+@cache
+def compile_attribute_validator(cls) -> Callable[[dict], dict | None]:
+    field_positions = get_attribute_field_positions(cls)
+    extra_position = field_positions.extra_position
+    type_hints = get_type_hints(cls, include_extras=True)
+    fields: dict[str, tuple | None] = {}
+    for key, position in field_positions.items():
+        exact_types: set[type] = set()
+        literal_values: set[tuple[type, Any]] = set()
+        if _collect_annotation_members(type_hints[key], exact_types, literal_values):
+            fields[key] = (position, frozenset(exact_types), frozenset(literal_values))
+        else:
+            fields[key] = None
+    required_keys = frozenset(getattr(cls, "__required_keys__", ()))
+    allow_extra = _get_pydantic_config(cls).get("extra") == "allow"
+
+    # Returns `None` whenever pydantic has to take over: complex annotations,
+    # values that need coercion (or are invalid), missing keys, and data whose
+    # keys are not in the canonical order (reordering costs as much as pydantic).
+    # Types are compared exactly, subclasses such as `bool` for `int` or
+    # `SafeString` for `str` are converted by pydantic and must go through it.
+    def validate(data: dict) -> dict | None:
+        previous_position = -1
+        for key, value in data.items():
+            if key in fields:
+                field = fields[key]
+                if field is None:
+                    return None
+
+                position, exact_types, literal_values = field
+                value_type = type(value)
+                if value_type not in exact_types and (
+                    value_type not in _LITERAL_TYPES
+                    or (value_type, value) not in literal_values
+                ):
+                    return None
+            elif allow_extra:
+                position = extra_position
+            else:
+                return None
+
+            if position < previous_position:
+                return None
+            previous_position = position
+
+        if not required_keys <= data.keys():
+            return None
+        return dict(data)
+
+    return validate
+
+
 def validate_dictionary_data(
     cls,
     data: dict,
@@ -23,37 +339,273 @@ def validate_dictionary_data(
     else:
         data_with_defaults = data
 
-    type_adapter = TypeAdapter(cls)
-    validated_data = type_adapter.validate_python(data_with_defaults)
+    # Trusted mode skips validation entirely, attributes are assumed to be
+    # correct as they come from the application's own (tested) code.
+    if is_trusted_mode():
+        return order_attribute_data(cls, data_with_defaults)
+
+    # Deferred validation only records the data, the element picks it up and
+    # it gets validated later on by `aether.validate_tree` (or when rendered).
+    if is_deferred_validation():
+        ordered_data = order_attribute_data(cls, data_with_defaults)
+        ordered_data[PENDING_VALIDATION_KEY] = PendingValidation(
+            cls, data_with_defaults, custom_validators
+        )
+        return ordered_data
+
+    return validate_attribute_data(cls, data_with_defaults, custom_validators)
+
+
+def validate_attribute_data(
+    cls, data: dict, custom_validators: list[ValidatorFunction] | None = None
+):
+    # Data made only of exactly typed simple values validates to itself, so
+    # pydantic is only needed for coercion, complex types and error reporting
+    # (which keeps the error shape `format_validation_error_message` expects).
+    # Only the data left to pydantic is worth looking up in the cache.
+    validated_data = compile_attribute_validator(cls)(data)
+    if validated_data is not None:
+        if custom_validators:
+            for validator in custom_validators:
+                validator(validated_data)
+        return validated_data
+
+    cache_key = None
+    if validation_cache.maxsize > 0:
+        cache_key = _get_validation_cache_key(cls, data, custom_validators)
+        if cache_key is not None:
+            validated_data = validation_cache.get(cache_key)
+            if validated_data is not None:
+                return validated_data
+
+    type_adapter = type_adapter_registry.get(cls)
+    validated_data = type_adapter.validate_python(data)
 
     if custom_validators:
         for validator in custom_validators:
             validator(validated_data)
 
+    if cache_key is not None:
+        validation_cache.set(cache_key, validated_data)
+
     return validated_data
 
 
-def flatten_attributes(attributes: dict[str, Any]) -> str:
+class StaticCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    bytes_served: int
+
+
+class StaticSubtreeCache:
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize = maxsize
+        # Structural keys of static elements are interned to ids, which keeps
+        # the key of a parent (made of its children's ids) shallow to hash.
+        # Ids are never reused, so dropping them can only cause misses.
+        self._ids: dict[tuple, int] = {}
+        self._id_counter = count()
+        self._rendered: OrderedDict[int, tuple[str, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._bytes_served = 0
+
+    def get_id(self, key: tuple) -> int:
+        # Called for every static element, hence without the lock: two threads
+        # racing on a new key only end up with two ids for the same structure.
+        static_id = self._ids.get(key)
+        if static_id is None:
+            if len(self._ids) >= self.maxsize * 4:
+                self._ids.clear()
+            static_id = self._ids[key] = next(self._id_counter)
+        return static_id
+
+    def get(self, static_id: int) -> str | None:
+        with self._lock:
+            rendered = self._rendered.get(static_id)
+            if rendered is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._bytes_served += rendered[1]
+            self._rendered.move_to_end(static_id)
+            return rendered[0]
+
+    def set(self, static_id: int, rendered: str) -> None:
+        encoded_size = len(rendered.encode())
+        with self._lock:
+            self._rendered[static_id] = (rendered, encoded_size)
+            self._rendered.move_to_end(static_id)
+            while len(self._rendered) > self.maxsize:
+                self._rendered.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._rendered) > self.maxsize:
+                self._rendered.popitem(last=False)
+            if not maxsize:
+                self._ids.clear()
+
+    def info(self) -> StaticCacheInfo:
+        with self._lock:
+            return StaticCacheInfo(
+                self._hits,
+                self._misses,
+                self.maxsize,
+                len(self._rendered),
+                self._bytes_served,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids.clear()
+            self._rendered.clear()
+            self._hits = 0
+            self._misses = 0
+            self._bytes_served = 0
+
+
+static_subtree_cache = StaticSubtreeCache()
+
+
+def set_static_cache_size(maxsize: int) -> None:
+    static_subtree_cache.resize(maxsize)
+
+
+class AttributeDict(dict):
+    # Element attributes, keeping their flattened string until they change.
+    __slots__ = ("_flattened",)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._flattened = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self._flattened = None
+        super().__delitem__(key)
+
+    def __ior__(self, other: Any) -> "AttributeDict":
+        self._flattened = None
+        return super().__ior__(other)
+
+    def pop(self, *args: Any) -> Any:
+        self._flattened = None
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[str, Any]:
+        self._flattened = None
+        return super().popitem()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self._flattened = None
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self._flattened = None
+        super().update(*args, **kwargs)
+
+    def clear(self) -> None:
+        self._flattened = None
+        super().clear()
+
+
+class AttributeStringTable:
+    # Flattened strings of attributes made only of `str` values, shared by all
+    # the elements with the same attributes. It stops growing once full.
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self._strings: dict[tuple, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, items: tuple) -> str | None:
+        return self._strings.get(items)
+
+    def add(self, items: tuple, string: str) -> str:
+        with self._lock:
+            if len(self._strings) < self.maxsize:
+                string = self._strings.setdefault(items, string)
+        return string
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+attribute_string_table = AttributeStringTable()
+
+# Attribute names declared by the attribute `TypedDict`s that escaping leaves
+# unchanged, filled by `AttributeKeyNormalizer.seed`.
+pre_escaped_attribute_keys: set[str] = set()
+
+# Attribute values whose rendering can not change, `str` subclasses other than
+# `SafeString` may render differently every time.
+_IMMUTABLE_ATTRIBUTE_TYPES = frozenset((str, SafeString, bool, int, float))
+_STR_ATTRIBUTE_TYPES = frozenset((str,))
+
+
+def _flatten_attributes(
+    attributes: dict[str, Any],
+    default_attributes: dict[str, tuple[type, Any, str]] | None = None,
+) -> str:
     attribute_list = []
     for key, value in attributes.items():
+        # Default attributes are rendered once per element class.
+        if default_attributes and key in default_attributes:
+            value_class, default_value, attribute_string = default_attributes[key]
+            if value.__class__ is value_class and value == default_value:
+                attribute_list.append(attribute_string)
+                continue
+
+        if key not in pre_escaped_attribute_keys:
+            key = safestring_escape(key, True)
         if isinstance(value, bool) and key != "value":
             if value is True:
-                attribute_list.append(f"{safestring_escape(key, True)}")
+                attribute_list.append(f"{key}")
         else:
-            attribute_list.append(
-                f'{safestring_escape(key, True)}="{safestring_escape(value, True)}"'
-            )
+            attribute_list.append(f'{key}="{safestring_escape(value, True)}"')
     return " ".join(attribute_list)
 
 
+def flatten_attributes(
+    attributes: dict[str, Any],
+    default_attributes: dict[str, tuple[type, Any, str]] | None = None,
+) -> str:
+    if not attributes:
+        return ""
+    flattened = getattr(attributes, "_flattened", None)
+    if flattened is not None:
+        return flattened
+
+    value_types = frozenset(map(type, attributes.values()))
+    if value_types == _STR_ATTRIBUTE_TYPES:
+        items = tuple(attributes.items())
+        flattened = attribute_string_table.get(items)
+        if flattened is None:
+            flattened = attribute_string_table.add(
+                items, _flatten_attributes(attributes, default_attributes)
+            )
+    else:
+        flattened = _flatten_attributes(attributes, default_attributes)
+
+    if isinstance(attributes, AttributeDict) and (
+        _IMMUTABLE_ATTRIBUTE_TYPES.issuperset(value_types)
+    ):
+        attributes._flattened = flattened
+    return flattened
+
+
 # TODO: Make this function more informative
 def handle_exception(exception):
     yield (
         '<pre style="border: solid 1px red; color: red; padding: 1rem; '
         'background-color: #ffdddd">'
-        f"    <code>~~~ Exception: {safestring_escape(exception)} ~~~</code>"
+        f"    <code>~~~ Exception: {safestring_escape(exception, True)} ~~~</code>"
         "</pre>"
-        f'<script>console.log("Error: {safestring_escape(exception)}")</script>'
+        f'<script>console.log("Error: {safestring_escape(exception, True)}")</script>'
     )
 
 
@@ -0,0 +1,15 @@
+from aether.compiled import compiled_component
+from aether.tags.html import A, Li, Td, Tr, Ul
+
+
+@compiled_component
+def user_row(user):
+    return Tr()(
+        Td(_class="name")(user["name"]),
+        Td()(A(href=f"/users/{user['id']}?tab=1&x")(user["email"].lower())),
+    )
+
+
+@compiled_component
+def items(values):
+    return Ul()([Li()(value) for value in values])
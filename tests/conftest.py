@@ -0,0 +1,12 @@
+import pytest
+
+from aether import set_static_cache_size
+from aether.utils import static_subtree_cache
+
+
+@pytest.fixture
+def static_cache():
+    set_static_cache_size(1024)
+    yield static_subtree_cache
+    set_static_cache_size(0)
+    static_subtree_cache.clear()
@@ -0,0 +1,70 @@
+import pytest
+
+from aether import deferred_validation, render, trusted_mode
+from aether.arena import DocumentArena
+from aether.tags.html import (
+    A,
+    Body,
+    Details,
+    Div,
+    Html,
+    Li,
+    P,
+    Picture,
+    Source,
+    Summary,
+    Ul,
+    Video,
+)
+
+
+def test_arena_renders_like_the_elements():
+    page = Html()(Body()(Div(_class="a")("x & y", Ul()([Li()(i) for i in "ab"]))))
+    assert render(DocumentArena().from_element(page)) == render(page)
+
+
+def test_arena_nodes_are_built_with_the_call_syntax():
+    document = DocumentArena()
+    page = document(Html, lang="en")(document(Body)(document(P)("a < b")))
+    assert render(page) == (
+        '<!DOCTYPE html><html lang="en"><body><p>a &lt; b</p></body></html>'
+    )
+    assert render(Div()(page.to_element())) == "<div>" + render(page) + "</div>"
+
+
+def test_arena_applies_the_child_rules():
+    document = DocumentArena()
+    with pytest.raises(ValueError, match="`Ul` can only have"):
+        document(Ul)(document(Div))
+    with pytest.raises(ValueError, match="At least one `summary` child"):
+        document(Details)(document(P))
+    with pytest.raises(ValueError, match="At least one `img` child"):
+        document(Picture)(document(Source, srcset="a.webp"))
+    with pytest.raises(ValueError, match="`src` attribute or `Source` child"):
+        document(Video)("x")
+
+    with pytest.warns(UserWarning, match="Ignoring `src` attribute"):
+        video = document(Video, src="a.mp4")(document(Source, src="b.mp4"))
+    assert render(video) == '<video><source src="b.mp4" /></video>'
+    assert render(document(Details)(document(Summary)("s"))) == (
+        "<details><summary>s</summary></details>"
+    )
+
+
+def test_arena_nodes_are_attached_once():
+    document = DocumentArena()
+    item = document(Li)("a")
+    with pytest.raises(ValueError, match="already attached"):
+        document(Ul)(item, item)
+    assert render(document(Ul)(item)) == "<ul><li>a</li></ul>"
+
+
+def test_arena_validates_deferred_attributes_and_keeps_trusted_entries_apart():
+    document = DocumentArena()
+    with deferred_validation(), pytest.raises(ValueError):
+        document(A, href=5)
+
+    with trusted_mode():
+        assert render(document(A, href=5)) == '<a href="5" target="_self"></a>'
+    with pytest.raises(ValueError):
+        document(A, href=5)
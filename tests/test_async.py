@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from aether import Suspense, aiter_render, arender, deferred_validation, render
+from aether.tags.html import A, Body, Div, Html, Li, P, Span, Ul
+
+from .test_rendering import EXPECTED_PAGE, build_page
+
+
+def test_arender_matches_render():
+    assert asyncio.run(arender(build_page())) == EXPECTED_PAGE
+
+
+def test_awaitable_and_async_iterator_children():
+    async def greeting():
+        await asyncio.sleep(0)
+        return Span()("hi & bye")
+
+    async def items():
+        for item in "ab":
+            await asyncio.sleep(0)
+            yield Li()(item)
+
+    async def lines():
+        return ["a", P()("b")]
+
+    page = Div()(greeting(), Ul()(items()), lines())
+    assert asyncio.run(arender(page)) == (
+        "<div><span>hi &amp; bye</span><ul><li>a</li><li>b</li></ul>a<p>b</p></div>"
+    )
+
+
+def test_async_children_are_type_checked_when_rendered():
+    async def item():
+        return Div()
+
+    rendered = asyncio.run(arender(Ul()(item())))
+    assert "`Ul` can only have str, Li, Script" in rendered
+
+
+def test_aiter_render_flushes_before_waiting():
+    async def slow():
+        await asyncio.sleep(0.01)
+        return "late"
+
+    async def collect():
+        return [chunk async for chunk in aiter_render(Div()(P()("early"), slow()))]
+
+    assert asyncio.run(collect()) == ["<div><p>early</p>", "late</div>"]
+
+
+def test_async_children_are_not_rendered_synchronously():
+    async def child():
+        return "x"
+
+    coroutine = child()
+    assert "`aether.arender`" in render(Div()(coroutine))
+    coroutine.close()
+
+
+def test_arender_raises_deferred_validation_errors():
+    with deferred_validation():
+        links = [A(href=5), A(href=6)]
+
+    with pytest.raises(ValueError, match=r"A\[0\]:\n.*\n.*A\[1\]:\n"):
+        asyncio.run(arender(Div()(links)))
+
+
+def test_suspended_chunks_are_streamed_before_the_closing_body_tag():
+    async def widget(delay, text):
+        await asyncio.sleep(delay)
+        return Span()(text)
+
+    async def collect():
+        page = Html()(
+            Body()(
+                Suspense(fallback=P()("loading"))(widget(0.02, "slow")),
+                Suspense(fallback=P()("loading"))(widget(0.01, "fast")),
+                "footer",
+            )
+        )
+        return [chunk async for chunk in aiter_render(page)]
+
+    chunks = asyncio.run(collect())
+    assert '<aether-suspense id="aether-suspense-0"><p>loading</p>' in chunks[0]
+    assert "footer" in chunks[0] and "</body>" not in chunks[0]
+    assert chunks[1].startswith('<template id="aether-suspense-1-content">')
+    assert "<span>fast</span>" in chunks[1]
+    assert chunks[2].startswith('<template id="aether-suspense-0-content">')
+    assert chunks[-1] == "</body></html>"
+
+
+def test_render_renders_suspense_children_in_place():
+    page = Div()(Suspense(fallback=P()("loading"))(Span()("ready")))
+    assert render(page) == (
+        "<div><aether-suspense><span>ready</span></aether-suspense></div>"
+    )
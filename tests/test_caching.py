@@ -0,0 +1,209 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+from aether import render
+from aether.caching import cached_fragment, invalidate_tag
+from aether.tags.html import Div, Li, Span, Ul
+
+
+def test_fragments_are_cached_by_arguments():
+    calls = []
+
+    @cached_fragment(maxsize=2)
+    def card(product_id):
+        calls.append(product_id)
+        return Div(_class="card")(f"<{product_id}>")
+
+    assert render(card(1)) == '<div class="card">&lt;1&gt;</div>'
+    card(1)
+    card(2)
+    card(3)
+    card(1)
+    assert calls == [1, 2, 3, 1]
+    assert card.cache_info().evictions == 2
+
+
+def test_arguments_of_different_types_are_kept_apart():
+    @cached_fragment
+    def value(argument):
+        return Span()(argument)
+
+    assert render(value(1), value(True), value(1.0)) == (
+        "<span>1</span><span>True</span><span>1.0</span>"
+    )
+
+
+def test_invalidation_by_key_and_tag():
+    calls = []
+
+    @cached_fragment(tags=lambda product_id: ("products", f"product:{product_id}"))
+    def card(product_id):
+        calls.append(product_id)
+        return Div()(product_id)
+
+    card(1)
+    card(2)
+    assert card.invalidate(1) and not card.invalidate(1)
+    assert invalidate_tag("product:2") == 1
+    card(1)
+    card(2)
+    assert calls == [1, 2, 1, 2]
+
+
+def test_fragments_keep_their_child_model():
+    @cached_fragment
+    def item():
+        return Li()("ok")
+
+    assert render(Ul()(item())) == "<ul><li>ok</li></ul>"
+
+
+def test_fragments_rendered_with_an_error_are_not_stored():
+    calls = []
+
+    def items():
+        yield Li()("a")
+        raise RuntimeError("broken")
+
+    @cached_fragment
+    def menu(argument):
+        calls.append(argument)
+        return Ul()(items())
+
+    assert "broken" in render(menu(1))
+    assert "broken" in render(menu(1))
+    assert calls == [1, 1]
+    assert menu.cache_info().currsize == 0
+
+
+def test_concurrent_misses_are_coalesced():
+    calls = []
+
+    @cached_fragment
+    def slow(argument):
+        calls.append(argument)
+        time.sleep(0.1)
+        return Div()(argument)
+
+    with ThreadPoolExecutor(16) as executor:
+        fragments = list(executor.map(slow, [1] * 16))
+
+    assert calls == [1]
+    assert {render(fragment) for fragment in fragments} == {"<div>1</div>"}
+    assert slow.cache_info().coalesced > 0
+
+
+def test_concurrent_async_misses_are_coalesced():
+    calls = []
+
+    @cached_fragment
+    async def slow(argument):
+        calls.append(argument)
+        await asyncio.sleep(0.05)
+        return Div()(argument)
+
+    async def gather():
+        return await asyncio.gather(*[slow(1) for _ in range(16)])
+
+    fragments = asyncio.run(gather())
+    assert calls == [1]
+    assert {render(fragment) for fragment in fragments} == {"<div>1</div>"}
+
+
+def test_waiters_render_on_their_own_when_the_render_fails():
+    calls = []
+    lock = threading.Lock()
+
+    @cached_fragment
+    def flaky(argument):
+        with lock:
+            calls.append(argument)
+            first = len(calls) == 1
+        time.sleep(0.05)
+        if first:
+            raise RuntimeError("broken")
+        return Div()("ok")
+
+    def call(argument):
+        try:
+            return render(flaky(argument))
+        except RuntimeError:
+            return "error"
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(call, [1] * 4))
+
+    assert results.count("error") == 1
+    assert results.count("<div>ok</div>") == 3
+
+
+def test_async_fragments_rendered_with_an_error_are_not_stored():
+    async def broken():
+        raise RuntimeError("broken")
+
+    @cached_fragment
+    async def menu(argument):
+        return Ul()(Li()(broken()))
+
+    assert "broken" in render(asyncio.run(menu(1)))
+    assert menu.cache_info().currsize == 0
+
+
+class ManualExecutor(Executor):
+    # Runs the submitted refreshes only when asked to.
+    def __init__(self):
+        self.pending = []
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.pending.append((fn, args, kwargs))
+        return Future()
+
+    def run_pending(self):
+        while self.pending:
+            fn, args, kwargs = self.pending.pop(0)
+            fn(*args, **kwargs)
+
+
+def test_stale_fragments_are_served_while_refreshing():
+    executor = ManualExecutor()
+    version = {"value": 0}
+
+    @cached_fragment(soft_ttl=0, ttl=10, refresh_executor=executor)
+    def dashboard(region):
+        return Div()(f"{region} {version['value']}")
+
+    assert render(dashboard("eu")) == "<div>eu 0</div>"
+    version["value"] = 1
+
+    # Served stale, with a single refresh submitted for both calls.
+    assert render(dashboard("eu")) == "<div>eu 0</div>"
+    assert render(dashboard("eu")) == "<div>eu 0</div>"
+    assert len(executor.pending) == 1
+
+    executor.run_pending()
+    assert render(dashboard("eu")) == "<div>eu 1</div>"
+
+    cache_info = dashboard.cache_info()
+    assert (cache_info.stale_hits, cache_info.refreshes) == (3, 1)
+    assert cache_info.refresh_errors == 0
+
+
+def test_stale_fragments_are_served_when_the_refresh_can_not_be_submitted():
+    executor = ThreadPoolExecutor(1)
+    executor.shutdown()
+    calls = []
+
+    @cached_fragment(soft_ttl=0, ttl=10, refresh_executor=executor)
+    def dashboard(region):
+        calls.append(region)
+        return Div()(region)
+
+    assert render(dashboard("eu")) == "<div>eu</div>"
+    assert render(dashboard("eu")) == "<div>eu</div>"
+    # The flight is released, the next stale hit tries again.
+    assert render(dashboard("eu")) == "<div>eu</div>"
+
+    assert calls == ["eu"]
+    assert dashboard.cache_info().refresh_errors == 2
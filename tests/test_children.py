@@ -0,0 +1,77 @@
+import pytest
+
+from aether import render
+from aether.tags.html import (
+    Col,
+    Colgroup,
+    Details,
+    Div,
+    Li,
+    P,
+    Picture,
+    Source,
+    Summary,
+    Ul,
+    Video,
+)
+from aether.tags.html._base import HTMLContentCategories
+
+
+def test_children_are_type_checked_however_they_are_passed():
+    assert render(Ul()("x", [Li()("a")], (Li()(b) for b in "b"))) == (
+        "<ul>x<li>a</li><li>b</li></ul>"
+    )
+    for children in (Div(), [Div()]):
+        with pytest.raises(ValueError, match="`Ul` can only have str, Li, Script"):
+            Ul()(children)
+
+
+def test_cardinality_is_checked():
+    assert render(Details()(Summary()("s"), P()("p"))) == (
+        "<details><summary>s</summary><p>p</p></details>"
+    )
+    with pytest.raises(ValueError, match="At least one `summary` child"):
+        Details()(P()("p"))
+    with pytest.raises(ValueError, match="Only one `summary` child"):
+        Details()(Summary()("a"), Summary()("b"))
+    with pytest.raises(ValueError, match="At least one `img` child"):
+        Picture()(Source(srcset="a.webp"))
+
+
+def test_categories_are_added_once_when_the_children_are_present():
+    element = Ul()
+    assert HTMLContentCategories.PALPABLE not in element.content_category
+
+    element(Li()("a"))(Li()("b"))
+    assert element.content_category.count(HTMLContentCategories.PALPABLE) == 1
+    assert HTMLContentCategories.PALPABLE not in Ul().content_category
+
+
+def test_elements_keep_their_own_child_rules():
+    with pytest.warns(UserWarning, match="Ignoring `src` attribute"):
+        video = Video(src="a.mp4")(Source(src="b.mp4"))
+    assert render(video) == '<video><source src="b.mp4" /></video>'
+
+    with pytest.raises(ValueError, match="`src` attribute or `Source` child"):
+        Video()("x")
+    with pytest.warns(UserWarning, match="Ignoring `span` attribute"):
+        Colgroup(span=2)(Col())
+
+
+def test_lazy_children_are_consumed_when_rendered():
+    consumed = []
+
+    def items():
+        for item in "ab":
+            consumed.append(item)
+            yield Li()(item)
+
+    element = Ul()(items())
+    assert consumed == []
+    assert render(element) == "<ul><li>a</li><li>b</li></ul>"
+    assert "already been consumed" in render(element)
+
+
+def test_lazy_children_are_type_checked_when_rendered():
+    element = Ul()(Div() for _ in range(1))
+    assert "`Ul` can only have str, Li, Script" in render(element)
@@ -0,0 +1,53 @@
+import importlib.util
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from aether import render, trusted_mode
+from aether.base import FrozenElement
+from aether.tags.html import Tr
+
+from . import components
+
+SCRIPT_PATH = Path(__file__).parents[1] / "scripts" / "compile_components.py"
+spec = importlib.util.spec_from_file_location("compile_components", SCRIPT_PATH)
+compile_components = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(compile_components)
+
+USER = {"id": 1, "name": "Zoë & co", "email": 'X"@Y.com'}
+
+
+def load_module(path):
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_generated_module_matches_the_components(tmp_path):
+    code, compiled, skipped = compile_components.generate_module(components)
+    assert (compiled, skipped) == (["user_row"], ["items"])
+
+    path = tmp_path / "generated.py"
+    path.write_text(code)
+    generated = load_module(path)
+    assert generated.items is components.items
+
+    expected = render(components.user_row.__wrapped__(USER))
+    assert isinstance(generated.user_row(USER), Tr)
+    with trusted_mode():
+        assert isinstance(generated.user_row(USER), FrozenElement)
+        assert render(generated.user_row(USER)) == expected
+
+
+def test_check_reports_outdated_modules(tmp_path):
+    runner = CliRunner()
+    arguments = [components.__name__, "-o", str(tmp_path)]
+
+    assert (
+        runner.invoke(compile_components.main, [*arguments, "--check"]).exit_code == 1
+    )
+    assert runner.invoke(compile_components.main, arguments).exit_code == 0
+    assert (
+        runner.invoke(compile_components.main, [*arguments, "--check"]).exit_code == 0
+    )
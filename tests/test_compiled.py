@@ -0,0 +1,85 @@
+from dataclasses import dataclass
+
+import pytest
+
+from aether import render, trusted_mode
+from aether.base import FrozenElement
+from aether.compiled import compiled_component
+from aether.tags.html import A, Button, Div, Input, Li, Td, Tr, Ul
+
+
+@dataclass
+class User:
+    id: int
+    name: str
+    email: str
+    admin: bool = False
+
+
+def row(user):
+    return Tr()(
+        Td(_class="name")(user.name),
+        Td()(A(href=f"/users/{user.id}?tab=1&x")(user.email.lower())),
+    )
+
+
+def link(url):
+    return A(href=url)("link")
+
+
+USERS = [
+    User(1, "a<b", 'x"@Y.com'),
+    User(2, "Zoë & co", "z@z", True),
+]
+
+
+def test_compiled_output_matches_the_component():
+    compiled_row = compiled_component(row)
+    with trusted_mode():
+        for user in USERS:
+            compiled = compiled_row(user)
+            assert isinstance(compiled, FrozenElement)
+            assert render(compiled) == render(row(user))
+
+
+def test_components_are_validated_outside_of_trusted_mode():
+    compiled_link = compiled_component(link)
+    with trusted_mode():
+        assert render(compiled_link("/a")) == render(link("/a"))
+
+    assert isinstance(compiled_link("/a"), A)
+    with pytest.raises(ValueError):
+        compiled_link(5)
+    with trusted_mode():
+        assert render(compiled_link(5)) == '<a href="5" target="_self">link</a>'
+
+
+def test_none_and_boolean_attribute_values_are_rendered_normally():
+    @compiled_component
+    def toggle(target):
+        return Button(popovertarget=target)("b")
+
+    @compiled_component
+    def checkbox(checked):
+        return Input(type="checkbox", checked=checked)
+
+    with trusted_mode():
+        assert isinstance(toggle("menu"), FrozenElement)
+        assert render(toggle(None)) == '<button type="button">b</button>'
+        assert render(checkbox(True)) == '<input type="checkbox" checked />'
+        assert render(checkbox(False)) == '<input type="checkbox" />'
+
+
+def test_data_dependent_components_are_rendered_normally():
+    @compiled_component
+    def items(values):
+        return Ul()([Li()(value) for value in values])
+
+    @compiled_component
+    def role(user):
+        return Div()("admin" if user.admin else "user")
+
+    with trusted_mode():
+        assert render(items(["a", "b"])) == "<ul><li>a</li><li>b</li></ul>"
+        assert render(role(USERS[1])) == "<div>admin</div>"
+        assert render(role(USERS[0])) == "<div>user</div>"
@@ -0,0 +1,62 @@
+from aether import render
+from aether.base import EMPTY_ATTRIBUTES, EMPTY_CHILDREN
+from aether.tags.html import Div, Html, Li, Span, Td, Ul
+from aether.utils import attribute_string_table, flatten_attributes
+
+
+def test_elements_have_no_instance_dict():
+    for element in (Div(), Li(_class="a")("b"), Html()):
+        assert not hasattr(element, "__dict__")
+
+
+def test_empty_containers_are_shared_until_accessed():
+    element = Div()
+    assert element._attributes is EMPTY_ATTRIBUTES
+    assert element._children is EMPTY_CHILDREN
+    assert render(element) == "<div></div>"
+
+    element.attributes["id"] = "main"
+    element.children.append("text")
+    assert render(element) == '<div id="main">text</div>'
+    assert render(Div()) == "<div></div>"
+
+
+def test_content_categories_are_extended_per_element():
+    element = Ul()(Li()("a"))
+    assert element.content_category != Ul().content_category
+    assert Ul.content_category == Ul().content_category
+
+
+def test_attribute_strings_are_flattened_again_when_attributes_change():
+    element = Div(_class="a", data_count=1)
+    assert render(element) == '<div class="a" data-count="1"></div>'
+
+    element.attributes["data-count"] = 2
+    assert render(element) == '<div class="a" data-count="2"></div>'
+    element.attributes.update({"id": "main"})
+    assert render(element) == '<div class="a" data-count="2" id="main"></div>'
+    del element.attributes["class"]
+    assert render(element) == '<div data-count="2" id="main"></div>'
+    element.attributes.clear()
+    assert render(element) == "<div></div>"
+
+
+def test_repeated_string_attributes_share_a_single_string():
+    classes = "flex items-center <b>"
+    first, second = Span(_class=classes), Span(_class=classes)
+    assert render(first) == '<span class="flex items-center &lt;b&gt;"></span>'
+    assert flatten_attributes(first._attributes) is flatten_attributes(
+        second._attributes
+    )
+    assert (("class", classes),) in attribute_string_table._strings
+
+
+def test_default_attributes_are_rendered_once_per_class():
+    assert Td._default_attributes["colspan"] == (int, 1, 'colspan="1"')
+    assert (Td._empty_start_tag, Td._end_tag) == ("<td>", "</td>")
+    assert render(Td()("a")) == '<td colspan="1" rowspan="1">a</td>'
+    assert render(Td(colspan=2)("a")) == '<td colspan="2" rowspan="1">a</td>'
+
+    element = Td()("a")
+    element.attributes["rowspan"] = 3
+    assert render(element) == '<td colspan="1" rowspan="3">a</td>'
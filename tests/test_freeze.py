@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from aether import arender, freeze, render, render_bytes
+from aether.arena import DocumentArena
+from aether.base import FrozenElement
+from aether.tags.html import A, Div, Img, Li, Nav, Picture, Source, Ul
+
+
+def build_nav():
+    return Nav()(Ul()([Li()(A(href=f"/{i}?a&b")(f"<{i}>")) for i in range(3)]))
+
+
+def test_frozen_elements_render_the_same_everywhere():
+    expected = render(build_nav())
+    frozen = freeze(build_nav())
+    assert isinstance(frozen, FrozenElement) and frozen == expected
+
+    page = Div()(frozen, "x")
+    assert render(page) == f"<div>{expected}x</div>"
+    assert asyncio.run(arender(page)) == f"<div>{expected}x</div>"
+    assert render_bytes(page) == f"<div>{expected}x</div>".encode()
+    assert render(DocumentArena().from_element(page)) == f"<div>{expected}x</div>"
+
+
+def test_frozen_elements_keep_their_encoding():
+    frozen = freeze(Li()("Zoë"), encoding="utf-8")
+    assert frozen.encoded == "<li>Zoë</li>".encode()
+    assert freeze(Li()("a")).encoded is None
+
+
+def test_frozen_elements_are_checked_as_the_original_element():
+    assert render(Ul()(freeze(Li()("a")))) == "<ul><li>a</li></ul>"
+    with pytest.raises(ValueError, match="`Ul` can only have"):
+        Ul()(freeze(Div()))
+
+    picture = Picture()(Source(srcset="a.webp"), freeze(Img(src="a.png", alt="")))
+    assert render(picture).endswith('<img alt="" src="a.png" /></picture>')
@@ -0,0 +1,184 @@
+import io
+import os
+import sys
+
+from aether import (
+    _write_all,
+    iter_render,
+    iter_render_bytes,
+    render,
+    render_bytes,
+    render_to,
+    render_to_fd,
+)
+from aether.safe_string import mark_safe
+from aether.tags.html import (
+    A,
+    Body,
+    Button,
+    Div,
+    Head,
+    Html,
+    Img,
+    Input,
+    Li,
+    Meta,
+    Span,
+    Table,
+    Tbody,
+    Td,
+    Title,
+    Tr,
+    Ul,
+)
+
+EXPECTED_PAGE = (
+    '<!DOCTYPE html><html lang="en"><head><title>T &amp; t</title>'
+    '<meta charset="utf-8" /></head><body class="bg" hx-boost="true">'
+    '<div draggable id="main" data-foo="1">text &lt;raw&gt;<b>safe</b>5<ul>'
+    '<li class="item">a&lt;b</li><li class="item">q&quot;x</li>'
+    '<li class="item">Zoë &amp; co</li></ul><table class="table">'
+    '<tbody><tr><td class="px-2" colspan="1" rowspan="1">a&lt;b</td>'
+    '<td colspan="1" rowspan="1">1</td></tr><tr>'
+    '<td class="px-2" colspan="1" rowspan="1">q&quot;x</td>'
+    '<td colspan="1" rowspan="1">2</td></tr><tr>'
+    '<td class="px-2" colspan="1" rowspan="1">Zoë &amp; co</td>'
+    '<td colspan="1" rowspan="1">3</td></tr></tbody></table>'
+    '<button type="submit" hx-get="/x?a=1&amp;b=2" formtarget="_self">Go</button>'
+    '<a href="/q?a=1&amp;b=&#x27;2&#x27;" target="_self">link</a>'
+    '<img alt="&quot;alt&quot;" src="a.png" />'
+    '<input name="c" type="checkbox" checked /><span>1True1.0</span>'
+    "</div></body></html>"
+)
+
+
+def build_page():
+    rows = [("a<b", 1), ('q"x', 2), ("Zoë & co", 3)]
+    return Html(lang="en")(
+        Head()(Title()("T & t"), Meta(charset="utf-8")),
+        Body(_class="bg", hx_boost="true")(
+            Div(id="main", data_foo="1", hidden=False, draggable=True)(
+                "text <raw>",
+                mark_safe("<b>safe</b>"),
+                None,
+                5,
+                Ul()([Li(_class="item")(name) for name, _ in rows]),
+                Table(_class="table")(
+                    Tbody()(
+                        [
+                            Tr()(Td(_class="px-2")(name), Td()(number))
+                            for name, number in rows
+                        ]
+                    )
+                ),
+                Button(type="submit", hx_get="/x?a=1&b=2")("Go"),
+                A(href="/q?a=1&b='2'")("link"),
+                Img(src="a.png", alt='"alt"'),
+                Input(type="checkbox", checked=True, name="c"),
+                Span()(1, True, 1.0),
+            ),
+        ),
+    )
+
+
+def test_page_renders_escaped():
+    assert render(build_page()) == EXPECTED_PAGE
+
+
+def test_deep_trees_render_without_recursion():
+    depth = sys.getrecursionlimit() * 2
+    element = Span()("leaf")
+    for _ in range(depth):
+        element = Div()(element)
+
+    assert render(element) == "<div>" * depth + "<span>leaf</span>" + "</div>" * depth
+
+
+def test_errors_are_rendered_in_place_of_the_failing_child():
+    def items():
+        yield Li()("a")
+        raise RuntimeError("broken")
+
+    rendered = render(Div()(Ul()(items()), Span()("after")))
+    assert rendered.startswith("<div><ul><li>a</li><pre")
+    assert "broken" in rendered
+    assert rendered.endswith("</ul><span>after</span></div>")
+
+
+def test_render_to_writes_in_chunks():
+    chunks = []
+    assert render_to(chunks.append, build_page(), flush_threshold=64) == len(
+        EXPECTED_PAGE
+    )
+    assert "".join(chunks) == EXPECTED_PAGE
+    assert len(chunks) > 1 and all(len(chunk) >= 64 for chunk in chunks[:-1])
+
+
+def test_render_to_writes_bytes_with_an_encoding():
+    page = Div()("Zoë & co", Span()("€"))
+    text_file, binary_file = io.StringIO(), io.BytesIO()
+
+    assert render_to(text_file, page) == len(render(page))
+    assert render_to(binary_file, page, flush_threshold=4, encoding="utf-8") == len(
+        render(page).encode()
+    )
+    assert binary_file.getvalue() == text_file.getvalue().encode()
+
+
+def test_iter_render_coalesces_fragments_into_chunks():
+    chunks = list(iter_render(build_page(), chunk_size=128))
+    assert "".join(chunks) == EXPECTED_PAGE
+    assert all(len(chunk) >= 128 for chunk in chunks[:-1])
+
+
+def test_iter_render_sends_a_smaller_first_chunk():
+    chunks = list(iter_render(build_page(), chunk_size=512, first_chunk_size=32))
+    assert "".join(chunks) == EXPECTED_PAGE
+    assert 32 <= len(chunks[0]) < 128
+    assert all(len(chunk) >= 512 for chunk in chunks[1:-1])
+
+
+def test_bytes_rendering():
+    encoded_page = EXPECTED_PAGE.encode()
+    assert render_bytes(build_page()) == encoded_page
+    assert b"".join(iter_render_bytes(build_page(), chunk_size=64)) == encoded_page
+    assert render_bytes(Span()("Zoë"), encoding="latin-1") == "<span>Zoë</span>".encode(
+        "latin-1"
+    )
+
+
+def test_render_to_fd_writes_everything(tmp_path):
+    path = tmp_path / "page.html"
+    with open(path, "wb") as file:
+        written = render_to_fd(file.fileno(), build_page(), chunk_size=64, batch_size=3)
+    assert path.read_bytes() == EXPECTED_PAGE.encode()
+    assert written == len(EXPECTED_PAGE.encode())
+
+
+def test_partial_writes_are_resumed():
+    written = bytearray()
+    calls = []
+
+    def short_writev(fd, buffers):
+        # Writes at most 5 bytes per call, across buffer boundaries.
+        calls.append(len(buffers))
+        data = b"".join(bytes(buffer) for buffer in buffers)[:5]
+        written.extend(data)
+        return len(data)
+
+    buffers = [b"<div>", b"Zo\xc3\xab", b"", b"</div>"]
+    assert _write_all(1, buffers, short_writev) == 15
+    assert bytes(written) == b"".join(buffers)
+    assert calls == [4, 3, 1]
+
+
+def test_partial_writes_without_writev(monkeypatch):
+    written = bytearray()
+
+    def short_write(fd, buffer):
+        written.extend(bytes(buffer)[:2])
+        return min(len(buffer), 2)
+
+    monkeypatch.setattr(os, "write", short_write)
+    assert _write_all(1, [b"abc", b"defg"], None) == 7
+    assert bytes(written) == b"abcdefg"
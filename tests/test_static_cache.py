@@ -0,0 +1,51 @@
+from aether import render
+from aether.tags.html import Div, P, Span
+
+from .test_rendering import EXPECTED_PAGE, build_page
+
+
+def test_render_is_identical_with_the_static_cache(static_cache):
+    page = build_page()
+    assert render(page) == EXPECTED_PAGE
+    assert render(page) == EXPECTED_PAGE
+    assert render(build_page()) == EXPECTED_PAGE
+    assert static_cache.info().hits
+
+
+def test_deep_static_chains_render_without_recursion(static_cache):
+    element = Span()("leaf")
+    for _ in range(1000):
+        element = Div()(element)
+
+    rendered = render(element)
+    assert rendered == "<div>" * 1000 + "<span>leaf</span>" + "</div>" * 1000
+    assert render(element) == rendered
+    assert static_cache.info().currsize == 1
+
+
+def test_constants_of_different_types_are_kept_apart(static_cache):
+    assert render(P()(1), P()(True), P()(1.0)) == "<p>1</p><p>True</p><p>1.0</p>"
+
+
+def test_output_with_a_rendered_error_is_not_stored(static_cache, monkeypatch):
+    def fail(self):
+        raise RuntimeError("broken")
+
+    monkeypatch.setattr(Span, "_render_start_tag", fail)
+    assert "broken" in render(Div()(Span()("a")))
+    assert static_cache.info().currsize == 0
+
+    monkeypatch.undo()
+    assert render(Div()(Span()("a"))) == "<div><span>a</span></div>"
+    assert static_cache.info().currsize == 1
+
+
+def test_changes_through_the_containers_are_rendered(static_cache):
+    element = Div(_class="a")("x")
+    assert render(element) == '<div class="a">x</div>'
+
+    element.attributes["id"] = "main"
+    assert render(element) == '<div class="a" id="main">x</div>'
+    element.children.append("y")
+    assert render(element) == '<div class="a" id="main">xy</div>'
+    assert render(Div(_class="a")("x")) == '<div class="a">x</div>'
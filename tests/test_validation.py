@@ -0,0 +1,180 @@
+import warnings
+from typing import Annotated
+
+import pytest
+from pydantic import Field
+from pydantic import ValidationError as PydanticValidationError
+
+from aether import (
+    deferred_validation,
+    render,
+    set_validation_cache_size,
+    trusted_mode,
+    validate_tree,
+)
+from aether.base import attribute_key_normalizer
+from aether.tags.html import A, AAttributes, Div, Li, Ul
+from aether.tags.html._base import GlobalHTMLAttributes
+from aether.utils import (
+    compile_attribute_validator,
+    type_adapter_registry,
+    validate_dictionary_data,
+    validation_cache,
+)
+
+
+def test_type_adapters_are_built_once_per_attribute_class():
+    type_adapter_registry.clear()
+    Div(tabindex="1")
+    Div(tabindex="2")
+
+    info = type_adapter_registry.info()
+    assert info.misses == 1 and info.hits == 1
+    assert type_adapter_registry.get(AAttributes) is type_adapter_registry.get(
+        AAttributes
+    )
+
+
+def test_invalid_attributes_are_still_rejected():
+    assert render(A(href="/a")) == '<a href="/a" target="_self"></a>'
+    with pytest.raises(ValueError):
+        A(href=5)
+
+
+def test_trusted_mode_skips_validation():
+    with trusted_mode():
+        assert render(A(href=5)) == '<a href="5" target="_self"></a>'
+    with pytest.raises(ValueError):
+        A(href=5)
+
+
+def test_trusted_mode_keeps_the_attribute_order():
+    attributes = {"target": "_blank", "data-x": "1", "href": "/a", "id": "b"}
+    validated = render(A(**attributes))
+    with trusted_mode():
+        assert render(A(**attributes)) == validated
+
+
+def test_attribute_keys_are_normalized_like_before():
+    assert attribute_key_normalizer.normalize("_class") == "class"
+    assert attribute_key_normalizer.normalize("hx_get") == "hx-get"
+    assert attribute_key_normalizer.normalize("__data_x") == "-data-x"
+    assert attribute_key_normalizer.normalize("id") == "id"
+    assert render(Div(_class="a", hx_get="/x")) == '<div class="a" hx-get="/x"></div>'
+
+
+@pytest.fixture
+def cached_validation():
+    validation_cache.clear()
+    set_validation_cache_size(64)
+    yield validation_cache
+    set_validation_cache_size(0)
+    validation_cache.clear()
+
+
+def test_cached_validation_renders_the_same(cached_validation):
+    uncached = render(A(href="/a", tabindex="1"))
+    assert render(A(href="/a", tabindex="1")) == uncached
+    assert render(A(href="/a", tabindex="1")) == uncached
+    assert cached_validation.info().hits > 0
+
+
+def test_failed_validation_is_not_cached(cached_validation):
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            A(href=5)
+    assert cached_validation.info().hits == 0
+
+
+def test_simple_attributes_are_validated_without_pydantic():
+    validator = compile_attribute_validator(AAttributes)
+    data = {"id": "b", "href": "/a", "target": "_blank"}
+    assert validator(data) == data
+    assert validator({"href": 5, "target": "_self"}) is None
+    assert validator({"target": "_self", "tabindex": "1"}) is None
+
+
+def test_annotated_constraints_are_checked():
+    class SizedAttributes(GlobalHTMLAttributes):
+        size: Annotated[int, Field(ge=1)]
+
+    assert validate_dictionary_data(SizedAttributes, {"size": 2}) == {"size": 2}
+    with pytest.raises(PydanticValidationError):
+        validate_dictionary_data(SizedAttributes, {"size": 0})
+
+
+def test_only_data_left_to_pydantic_is_cached(cached_validation):
+    Div(id="a")
+    Div(id="a")
+    assert cached_validation.info() == (0, 0, 64, 0)
+
+    Div(tabindex="1")
+    assert cached_validation.info().currsize == 1
+
+
+def test_deferred_validation_reports_the_element_path():
+    with deferred_validation():
+        tree = Div()(Ul()([Li()("a"), Li(tabindex="x")("b")]))
+
+    with pytest.raises(ValueError, match=r"Div > Ul\[0\] > Li\[1\]"):
+        validate_tree(tree)
+
+
+def test_deferred_validation_runs_on_first_render():
+    with deferred_validation():
+        link = A(href="/a", tabindex="1")
+    assert link._pending_validation is not None
+
+    assert render(link) == '<a tabindex="1" href="/a" target="_self"></a>'
+    assert link._pending_validation is None
+
+
+def test_failed_elements_keep_raising():
+    with deferred_validation():
+        link = A(href=5)
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            render(link)
+
+
+def test_deferred_children_raise_from_render():
+    with deferred_validation():
+        links = [A(href=5), A(href=6)]
+
+    with pytest.raises(ValueError, match=r"Div\[0\] > A\[0\]:\n.*\n.*A\[1\]:\n"):
+        render(Div()(Div()(links)))
+
+
+def test_public_validation_does_not_leak_into_the_next_element():
+    with deferred_validation():
+        AAttributes.validate({"href": 5})
+    assert Div()._pending_validation is None
+
+
+def test_validate_tree_warns_about_lazy_children():
+    with deferred_validation():
+        tree = Ul()(Li()(item) for item in "ab")
+
+    with pytest.warns(UserWarning, match="Lazy children of `Ul`"):
+        validate_tree(tree)
+
+
+def test_render_does_not_warn_about_lazy_children():
+    with deferred_validation():
+        tree = Ul()(Li()(item) for item in "ab")
+        other_tree = Ul()([Li()(item) for item in "ab"])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert render(tree) == "<ul><li>a</li><li>b</li></ul>"
+        validate_tree(other_tree)
+
+
+def test_invalid_lazy_children_are_rendered_as_errors():
+    with deferred_validation():
+        tree = Div()(iter([A(href="/a")("link"), A(href=5)("link")]))
+
+    rendered = render(tree)
+    assert rendered.startswith('<div><a href="/a" target="_self">link</a><pre')
+    assert "Exception" in rendered